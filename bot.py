@@ -5,6 +5,7 @@ Discord is treated purely as an I/O surface; cognition runs continuously.
 
 import asyncio
 import os
+import sys
 from pathlib import Path
 import resource
 
@@ -33,7 +34,7 @@ def _load_env() -> None:
 
 _load_env()
 
-from discord_adapter import main  # noqa: E402
+from discord_adapter import _install_uvloop, main  # noqa: E402
 
 
 def _log_mem(label: str) -> None:
@@ -43,9 +44,14 @@ def _log_mem(label: str) -> None:
 
 if __name__ == "__main__":
     _log_mem("pre-run")
+    _install_uvloop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
         # PM2 restarts typically send SIGINT which surfaces as KeyboardInterrupt.
         # Exit cleanly to avoid noisy tracebacks in logs.
         print("[SHUTDOWN] Received interrupt; exiting cleanly.", flush=True)
+    except ExceptionGroup as group:
+        for exc in group.exceptions:
+            print(f"[TASK-ERROR] {type(exc).__name__}: {exc}", file=sys.stderr, flush=True)
+        raise
@@ -1,9 +1,14 @@
 import asyncio
 import concurrent.futures
+import linecache
 import os
+import queue
 import re
 import sys
+import threading
 import time
+from collections import Counter
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 import resource
@@ -49,17 +54,49 @@ from vyxen_core import (
     SessionStore,
 )
 from vyxen_core.actions import RateLimiter
-from vyxen_core.audit import build_logger, log_decision
-from vyxen_core.action_journal import ActionJournal, ActionEntry
+from vyxen_core.audit import audit_dropped, build_logger, log_decision
+from vyxen_core.action_journal import ActionJournal, ActionEntry, wall_time
 from vyxen_core.macro_store import MacroStore
 from vyxen_core.schedule_store import ScheduleStore
 from vyxen_core.faq_store import FaqStore
+from vyxen_core.fast_queue import FastAsyncQueue
 from vyxen_core.setup_wizard import SetupWizardStore
 from vyxen_core.safety import CircuitBreaker
 
 
 load_dotenv()
 
+_SEND_MESSAGES_FLAG = discord.Permissions.send_messages.flag
+
+
+def _find_by_name(items, name: str):
+    """
+    Find an item by exact name, falling back to a case-insensitive match, in one pass.
+    """
+    name_lower = name.lower()
+    fallback = None
+    for item in items:
+        item_name = item.name
+        if item_name == name:
+            return item
+        if fallback is None and item_name.lower() == name_lower:
+            fallback = item
+    return fallback
+
+
+def _clip(items: list[str], limit: int = 6) -> str:
+    if len(items) <= limit:
+        return ", ".join(items)
+    return f"{', '.join(items[:limit])}, +{len(items) - limit}"
+
+
+def _name_arg(data: dict, key: str, default: str = "", max_len: int = 90) -> str:
+    """
+    Read a name-like field from requested_changes as a stripped, length-capped string.
+    """
+    value = data.get(key)
+    return (str(value).strip() if value else default)[:max_len]
+
 
 class DiscordAdapter(discord.Client):
     def __init__(
@@ -83,6 +120,7 @@ class DiscordAdapter(discord.Client):
         self.cognition = cognition
         self.stimulus_queue = stimulus_queue
         self.action_queue = action_queue
+        self._put_stim = stimulus_queue.put_nowait
         self.logger = build_logger(config)
         self.rate_limiter = RateLimiter(config)
         self.tool_breaker = CircuitBreaker("tool_execution", threshold=2, window_seconds=120.0, cooldown_seconds=600.0)
@@ -96,6 +134,13 @@ class DiscordAdapter(discord.Client):
         self._faqs = FaqStore()
         self._activity_counts: dict[str, dict] = {}
         self._user_activity: dict[str, dict] = {}
+        self._chunk_locks: dict[int, asyncio.Lock] = {}
+        self._send_perm_cache: dict[tuple[int, int], bool] = {}
+        # Only channels discord.py does not track (fetch_channel fallbacks) are cached here; those
+        # REST objects never receive gateway updates, so entries expire after a short TTL.
+        self._channel_cache: dict[int, tuple[float, discord.abc.Messageable]] = {}
+        self._channel_cache_limit = 512
+        self._channel_cache_ttl = 60.0
 
     async def setup_hook(self) -> None:
         self._action_worker = asyncio.create_task(self._action_executor())
@@ -167,7 +212,7 @@ class DiscordAdapter(discord.Client):
     ) -> None:
         try:
             self._action_journal.record(
-                user_id=str(author_id),
+                user_id=author_id,
                 action_type=action_type,
                 targets=targets,
                 before_state=before_state,
@@ -191,6 +236,30 @@ class DiscordAdapter(discord.Client):
                 pass
         return data
 
+    async def _get_or_fetch_member(self, guild: discord.Guild, member_id: int) -> Optional[discord.Member]:
+        """
+        Resolve a member from cache, chunking the guild once (when the members intent
+        allows it) before falling back to a REST fetch.
+        """
+        member = guild.get_member(member_id)
+        if member is not None:
+            return member
+        if not guild.chunked and self.intents.members:
+            lock = self._chunk_locks.setdefault(guild.id, asyncio.Lock())
+            async with lock:
+                if not guild.chunked:
+                    try:
+                        await guild.chunk(cache=True)
+                    except Exception:
+                        pass
+            member = guild.get_member(member_id)
+            if member is not None:
+                return member
+        try:
+            return await guild.fetch_member(member_id)
+        except Exception:
+            return None
+
     async def _undo_action(self, entry: ActionEntry, guild: discord.Guild, context_channel: discord.abc.GuildChannel, author_id: str) -> ActionResult:
         try:
             atype = entry.action_type
@@ -279,6 +348,7 @@ class DiscordAdapter(discord.Client):
                 if category_obj is None:
                     return ActionResult(intent=None, success=False, detail="Category missing for undo")
                 # Restore overwrites for recorded targets on category and children.
+                reason = f"Vyxen undo lock by {author_id}"
                 for ch_id, target_map in before_map.items():
                     ch = guild.get_channel(int(ch_id))
                     if ch is None:
@@ -292,7 +362,7 @@ class DiscordAdapter(discord.Client):
                             if hasattr(ow, k):
                                 setattr(ow, k, v)
                         try:
-                            await ch.set_permissions(target_role, overwrite=ow, reason=f"Vyxen undo lock by {author_id}")
+                            await ch.set_permissions(target_role, overwrite=ow, reason=reason)
                         except Exception:
                             continue
                 return ActionResult(intent=None, success=True, detail="Restored category visibility")
@@ -439,15 +509,7 @@ class DiscordAdapter(discord.Client):
             salience=salience,
             timestamp=message.created_at.timestamp(),
         )
-        await self._enqueue_stimulus(stimulus)
-        if stimulus.context.get("mentions_bot"):
-            try:
-                print(
-                    f"[MENTION] from {message.author} in #{message.channel} msg_id={message.id} content_len={len(message.content)}"
-                )
-            except Exception:
-                pass
-
+        batch = [stimulus]
         for attachment in message.attachments:
             attachment_stimulus = Stimulus(
                 type="attachment",
@@ -465,7 +527,15 @@ class DiscordAdapter(discord.Client):
                 salience=min(1.0, salience + 0.1),
                 timestamp=message.created_at.timestamp(),
             )
-            await self._enqueue_stimulus(attachment_stimulus)
+            batch.append(attachment_stimulus)
+        self._enqueue_stimuli(batch)
+        if stimulus.context.get("mentions_bot"):
+            try:
+                print(
+                    f"[MENTION] from {message.author} in #{message.channel} msg_id={message.id} content_len={len(message.content)}"
+                )
+            except Exception:
+                pass
 
     async def on_member_join(self, member: discord.Member) -> None:
         stim = Stimulus(
@@ -500,13 +570,46 @@ class DiscordAdapter(discord.Client):
         return
 
     async def on_guild_role_delete(self, role: discord.Role) -> None:
-        return
+        self._invalidate_send_perms(role.guild.id)
+
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        self._invalidate_send_perms(after.guild.id)
 
     async def on_guild_channel_create(self, channel: discord.abc.GuildChannel) -> None:
         return
 
     async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
-        return
+        self._send_perm_cache.pop((channel.guild.id, channel.id), None)
+        self._channel_cache.pop(channel.id, None)
+
+    async def on_raw_thread_delete(self, payload: discord.RawThreadDeleteEvent) -> None:
+        self._send_perm_cache.pop((payload.guild_id, payload.thread_id), None)
+        self._channel_cache.pop(payload.thread_id, None)
+
+    async def on_raw_thread_update(self, payload: discord.RawThreadUpdateEvent) -> None:
+        # Archive/lock state lives on the thread object; drop any fetched copy.
+        self._channel_cache.pop(payload.thread_id, None)
+
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        self._invalidate_send_perms(guild.id)
+        stale = [
+            cid
+            for cid, (_, ch) in self._channel_cache.items()
+            if getattr(getattr(ch, "guild", None), "id", None) == guild.id
+        ]
+        for cid in stale:
+            self._channel_cache.pop(cid, None)
+
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel) -> None:
+        # Category overwrite changes can affect synced children, so drop the whole guild.
+        self._invalidate_send_perms(after.guild.id)
+
+    async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        if self.user is not None and after.id == self.user.id:
+            self._invalidate_send_perms(after.guild.id)
+
+    def _invalidate_send_perms(self, guild_id: int) -> None:
+        self._send_perm_cache = {k: v for k, v in self._send_perm_cache.items() if k[0] != guild_id}
 
     async def _action_executor(self) -> None:
         while True:
@@ -525,7 +628,7 @@ class DiscordAdapter(discord.Client):
                         f"[ACTION] {intent.type} target={intent.target_id} success={getattr(result,'success',None)} detail={getattr(result,'detail','')}"
                     )
 
-            audit_context = intent.metadata.get("audit_context")
+            audit_context = intent.audit_context
             if audit_context:
                 try:
                     log_decision(
@@ -808,12 +911,9 @@ class DiscordAdapter(discord.Client):
         if channel is None:
             channel = context_channel
 
-        member = guild.get_member(int(author_id))
+        member = await self._get_or_fetch_member(guild, int(author_id))
         if member is None:
-            try:
-                member = await guild.fetch_member(int(author_id))
-            except Exception:
-                return ActionResult(intent=intent, success=False, detail="Member not found")
+            return ActionResult(intent=intent, success=False, detail="Member not found")
         perms = context_channel.permissions_for(member)
         author_whitelisted_admin = str(author_id) in self.config.admin_user_ids
         has_admin = (
@@ -907,18 +1007,13 @@ class DiscordAdapter(discord.Client):
 
                 await channel.set_permissions(role, overwrite=overwrites, reason="Vyxen tool call update")
 
-                def _clip(items: list[str], limit: int = 8) -> str:
-                    if len(items) <= limit:
-                        return ", ".join(items)
-                    return ", ".join(items[:limit]) + f", +{len(items) - limit}"
-
                 parts: list[str] = []
                 if allow_list:
-                    parts.append(f"allow: {_clip(allow_list)}")
+                    parts.append(f"allow: {_clip(allow_list, 8)}")
                 if deny_list:
-                    parts.append(f"deny: {_clip(deny_list)}")
+                    parts.append(f"deny: {_clip(deny_list, 8)}")
                 if clear_list:
-                    parts.append(f"clear: {_clip(clear_list)}")
+                    parts.append(f"clear: {_clip(clear_list, 8)}")
                 summary = "; ".join(parts) if parts else "updated overwrites"
 
                 detail = "; ".join([f"{name}:{before}->{after}" for name, before, after in changes[:8]])
@@ -951,24 +1046,11 @@ class DiscordAdapter(discord.Client):
             return ActionResult(intent=intent, success=True, detail="Reported permissions")
 
         elif intent_type == "role_permissions_report":
-            role_obj = None
-            if role_id is not None:
-                try:
-                    role_obj = guild.get_role(int(role_id))
-                except Exception:
-                    role_obj = None
+            role_obj = guild.get_role(int(role_id)) if role_id is not None else None
             if role_obj is None:
                 role_name = (requested_changes.get("role_name") or "").strip()
                 if role_name:
-                    try:
-                        role_obj = discord.utils.get(guild.roles, name=role_name)
-                    except Exception:
-                        role_obj = None
-                    if role_obj is None:
-                        for r in guild.roles:
-                            if r.name.lower() == role_name.lower():
-                                role_obj = r
-                                break
+                    role_obj = _find_by_name(guild.roles, role_name)
             if role_obj is None:
                 await _send_progress("Which role should I audit? Mention it like @Admin (or quote the role name).")
                 return ActionResult(intent=intent, success=False, detail="Role not found")
@@ -991,24 +1073,11 @@ class DiscordAdapter(discord.Client):
                 return ActionResult(intent=intent, success=False, detail=f"Role permissions report failed: {exc}")
 
         elif intent_type == "role_permissions_update":
-            role_obj = None
-            if role_id is not None:
-                try:
-                    role_obj = guild.get_role(int(role_id))
-                except Exception:
-                    role_obj = None
+            role_obj = guild.get_role(int(role_id)) if role_id is not None else None
             if role_obj is None:
                 role_name = (requested_changes.get("role_name") or "").strip()
                 if role_name:
-                    try:
-                        role_obj = discord.utils.get(guild.roles, name=role_name)
-                    except Exception:
-                        role_obj = None
-                    if role_obj is None:
-                        for r in guild.roles:
-                            if r.name.lower() == role_name.lower():
-                                role_obj = r
-                                break
+                    role_obj = _find_by_name(guild.roles, role_name)
             if role_obj is None:
                 await _send_progress("Which role should I change? Mention it like @Admin (or quote the role name).")
                 return ActionResult(intent=intent, success=False, detail="Role not found")
@@ -1134,7 +1203,7 @@ class DiscordAdapter(discord.Client):
             recent = sorted(entries, key=lambda e: e.timestamp, reverse=True)[:8]
             lines = []
             for entry in recent:
-                when = int(max(0, time.time() - entry.timestamp) // 60)
+                when = int(max(0, time.time() - wall_time(entry)) // 60)
                 age = f"{when}m ago" if when else "just now"
                 targets = entry.targets
                 target_desc = ", ".join(f"{k}={v}" for k, v in targets.items() if v) if targets else ""
@@ -1154,15 +1223,14 @@ class DiscordAdapter(discord.Client):
                 await _send_progress("I don’t have enough recorded data yet to answer that.")
                 return ActionResult(intent=intent, success=True, detail="No audit data")
             # Group by day
-            from datetime import datetime
             today = datetime.utcnow().date()
-            day_entries = [e for e in entries if datetime.utcfromtimestamp(e.timestamp).date() == today]
+            day_entries = [e for e in entries if datetime.utcfromtimestamp(wall_time(e)).date() == today]
             if not day_entries:
                 await _send_progress("I don’t have enough recorded data yet to answer that.")
                 return ActionResult(intent=intent, success=True, detail="No audit data")
             lines = []
             for entry in sorted(day_entries, key=lambda e: e.timestamp, reverse=True)[:12]:
-                ts = datetime.utcfromtimestamp(entry.timestamp).strftime("%H:%M")
+                ts = datetime.utcfromtimestamp(wall_time(entry)).strftime("%H:%M")
                 target_desc = ", ".join(f"{k}={v}" for k, v in entry.targets.items() if v) if entry.targets else ""
                 lines.append(f"{ts} UTC: {entry.action_type} ({target_desc})")
             await _send_progress("Today's admin actions:\n" + "\n".join(lines)[:1800])
@@ -1229,12 +1297,7 @@ class DiscordAdapter(discord.Client):
             user_id = str(requested_changes.get("user_id") or "").strip()
             if not user_id:
                 return ActionResult(intent=intent, success=False, detail="No user specified")
-            member = guild.get_member(int(user_id))
-            if member is None:
-                try:
-                    member = await guild.fetch_member(int(user_id))
-                except Exception:
-                    member = None
+            member = await self._get_or_fetch_member(guild, int(user_id))
             if member is None:
                 await _send_progress("I couldn’t find that user here.")
                 return ActionResult(intent=intent, success=False, detail="User not found")
@@ -1286,12 +1349,7 @@ class DiscordAdapter(discord.Client):
             if role_obj is None:
                 await _send_progress("I couldn’t find that role to preview.")
                 return ActionResult(intent=intent, success=False, detail="Role not found")
-            member = guild.get_member(int(member_id)) if member_id else None
-            if member is None:
-                try:
-                    member = await guild.fetch_member(int(member_id))
-                except Exception:
-                    member = None
+            member = await self._get_or_fetch_member(guild, int(member_id)) if member_id else None
             if member is None:
                 await _send_progress("I couldn’t find that user.")
                 return ActionResult(intent=intent, success=False, detail="User not found")
@@ -1318,7 +1376,6 @@ class DiscordAdapter(discord.Client):
                 return ActionResult(intent=intent, success=True, detail="No activity data")
             window_days = set()
             for i in range(7):
-                from datetime import datetime, timedelta
                 day = (datetime.utcnow() - timedelta(days=i)).strftime("%Y-%m-%d")
                 window_days.add(day)
             channel_totals: list[tuple[int, int]] = []
@@ -1354,9 +1411,7 @@ class DiscordAdapter(discord.Client):
             if joined:
                 msg += f" since joining on {joined.date()}."
             elif activity.get("first_seen"):
-                import datetime
-
-                first = datetime.datetime.utcfromtimestamp(activity["first_seen"]).date()
+                first = datetime.utcfromtimestamp(activity["first_seen"]).date()
                 msg += f" since first seen on {first}."
             last_ts = activity.get("last_ts")
             if last_ts:
@@ -1375,24 +1430,11 @@ class DiscordAdapter(discord.Client):
 
         elif intent_type == "assign_role":
             member_id = str(requested_changes.get("member_id") or "").strip()
-            role_obj = None
-            if role_id is not None:
-                try:
-                    role_obj = guild.get_role(int(role_id))
-                except Exception:
-                    role_obj = None
+            role_obj = guild.get_role(int(role_id)) if role_id is not None else None
             if role_obj is None:
                 role_name = (requested_changes.get("role_name") or "").strip()
                 if role_name:
-                    try:
-                        role_obj = discord.utils.get(guild.roles, name=role_name)
-                    except Exception:
-                        role_obj = None
-                    if role_obj is None:
-                        for r in guild.roles:
-                            if r.name.lower() == role_name.lower():
-                                role_obj = r
-                                break
+                    role_obj = _find_by_name(guild.roles, role_name)
             if not member_id:
                 return ActionResult(intent=intent, success=False, detail="No member specified")
             if role_obj is None:
@@ -1403,12 +1445,7 @@ class DiscordAdapter(discord.Client):
             if getattr(role_obj, "managed", False):
                 return ActionResult(intent=intent, success=False, detail="Refusing to assign a managed/integration role")
 
-            target = guild.get_member(int(member_id))
-            if target is None:
-                try:
-                    target = await guild.fetch_member(int(member_id))
-                except Exception:
-                    target = None
+            target = await self._get_or_fetch_member(guild, int(member_id))
             if target is None:
                 await _send_progress("I couldn’t find that member in this server.")
                 return ActionResult(intent=intent, success=False, detail="Member not found")
@@ -1691,11 +1728,11 @@ class DiscordAdapter(discord.Client):
                 return ActionResult(intent=intent, success=False, detail=f"Macro execution failed: {exc}")
 
         elif intent_type == "last_action_explain":
-            entry = self._action_journal.last(str(author_id))
+            entry = self._action_journal.last(author_id)
             if not entry:
                 await _send_progress("I don’t have a recent change recorded for you yet.")
                 return ActionResult(intent=intent, success=True, detail="No last action recorded")
-            age = max(0, time.time() - entry.timestamp)
+            age = max(0, time.time() - wall_time(entry))
             mins = int(age // 60)
             age_note = f"{mins} minute(s) ago" if mins else "just now"
             target_desc = ", ".join(f"{k}={v}" for k, v in entry.targets.items() if v) if entry.targets else ""
@@ -1708,7 +1745,7 @@ class DiscordAdapter(discord.Client):
             return ActionResult(intent=intent, success=True, detail="Reported last action")
 
         elif intent_type == "undo_last_action":
-            entry = self._action_journal.pop_last_reversible(str(author_id))
+            entry = self._action_journal.pop_last_reversible(author_id)
             if not entry:
                 await _send_progress("I don’t have anything to undo for you yet.")
                 return ActionResult(intent=intent, success=False, detail="No reversible action")
@@ -1717,24 +1754,11 @@ class DiscordAdapter(discord.Client):
 
         elif intent_type == "delete_role":
             confirmed = bool(requested_changes.get("confirmed"))
-            role_obj = None
-            if role_id is not None:
-                try:
-                    role_obj = guild.get_role(int(role_id))
-                except Exception:
-                    role_obj = None
+            role_obj = guild.get_role(int(role_id)) if role_id is not None else None
             if role_obj is None:
                 role_name = (requested_changes.get("role_name") or "").strip()
                 if role_name:
-                    try:
-                        role_obj = discord.utils.get(guild.roles, name=role_name)
-                    except Exception:
-                        role_obj = None
-                    if role_obj is None:
-                        for r in guild.roles:
-                            if r.name.lower() == role_name.lower():
-                                role_obj = r
-                                break
+                    role_obj = _find_by_name(guild.roles, role_name)
             if role_obj is None:
                 await _send_progress("Which role should I delete? Say `delete role \"RoleName\"` (or mention it).")
                 return ActionResult(intent=intent, success=False, detail="Role not found")
@@ -1788,12 +1812,7 @@ class DiscordAdapter(discord.Client):
                 )
                 return ActionResult(intent=intent, success=True, detail="Confirmation requested")
             try:
-                target = guild.get_member(int(member_id))
-                if target is None:
-                    try:
-                        target = await guild.fetch_member(int(member_id))
-                    except Exception:
-                        target = None
+                target = await self._get_or_fetch_member(guild, int(member_id))
                 ban_target = target if target is not None else discord.Object(id=int(member_id))
                 await guild.ban(ban_target, reason=f"Vyxen ban by {author_id}", delete_message_days=0)
                 await _send_progress(f"Banned `{member_id}`.")
@@ -1822,18 +1841,11 @@ class DiscordAdapter(discord.Client):
                 duration_seconds = 600
             if not member_id:
                 return ActionResult(intent=intent, success=False, detail="No member specified")
-            member = guild.get_member(int(member_id))
-            if member is None:
-                try:
-                    member = await guild.fetch_member(int(member_id))
-                except Exception:
-                    member = None
+            member = await self._get_or_fetch_member(guild, int(member_id))
             if member is None:
                 await _send_progress("I couldn’t find that member in this server.")
                 return ActionResult(intent=intent, success=False, detail="Member not found")
             try:
-                from datetime import timedelta
-
                 await member.timeout(timedelta(seconds=duration_seconds), reason=f"Vyxen timeout by {author_id}")
                 mins = max(1, int(round(duration_seconds / 60)))
                 await _send_progress(f"Timed out {member.mention} for ~{mins} minute(s).")
@@ -1857,12 +1869,7 @@ class DiscordAdapter(discord.Client):
             member_id = str(requested_changes.get("member_id") or "").strip()
             if not member_id:
                 return ActionResult(intent=intent, success=False, detail="No member specified")
-            member = guild.get_member(int(member_id))
-            if member is None:
-                try:
-                    member = await guild.fetch_member(int(member_id))
-                except Exception:
-                    member = None
+            member = await self._get_or_fetch_member(guild, int(member_id))
             if member is None:
                 await _send_progress("I couldn’t find that member in this server.")
                 return ActionResult(intent=intent, success=False, detail="Member not found")
@@ -1876,30 +1883,27 @@ class DiscordAdapter(discord.Client):
                 name = re.sub(r"-{2,}", "-", name).strip("-")
                 return name or "channel"
 
-            category_name = str(requested_changes.get("category_name") or "quarantine").strip()[:90]
-            channel_name = str(requested_changes.get("channel_name") or "quarantine").strip()[:90]
-            role_name = str(requested_changes.get("role_name") or "quarantine").strip()[:90]
+            category_name = _name_arg(requested_changes, "category_name", "quarantine")
+            channel_name = _name_arg(requested_changes, "channel_name", "quarantine")
+            role_name = _name_arg(requested_changes, "role_name", "quarantine")
+            reason = f"Vyxen quarantine by {author_id}"
 
             await _send_progress(f"Okay—setting up quarantine for {member.mention}. This can take a moment…")
 
             # Ensure role
-            role_obj = discord.utils.get(guild.roles, name=role_name) or next(
-                (r for r in guild.roles if r.name.lower() == role_name.lower()), None
-            )
+            role_obj = _find_by_name(guild.roles, role_name)
             if role_obj is None:
                 try:
-                    role_obj = await guild.create_role(name=role_name, reason=f"Vyxen quarantine by {author_id}")
+                    role_obj = await guild.create_role(name=role_name, reason=reason)
                 except Exception as exc:
                     self.tool_breaker.record_failure(str(exc))
                     return ActionResult(intent=intent, success=False, detail=f"Create quarantine role failed: {exc}")
 
             # Ensure category
-            category_obj = discord.utils.get(guild.categories, name=category_name) or next(
-                (c for c in guild.categories if c.name.lower() == category_name.lower()), None
-            )
+            category_obj = _find_by_name(guild.categories, category_name)
             if category_obj is None:
                 try:
-                    category_obj = await guild.create_category(name=category_name, reason=f"Vyxen quarantine by {author_id}")
+                    category_obj = await guild.create_category(name=category_name, reason=reason)
                 except Exception as exc:
                     self.tool_breaker.record_failure(str(exc))
                     return ActionResult(intent=intent, success=False, detail=f"Create quarantine category failed: {exc}")
@@ -1909,14 +1913,15 @@ class DiscordAdapter(discord.Client):
             channel_obj = None
             try:
                 existing = [ch for ch in guild.text_channels if ch.name == chan_sanitized]
-                existing_in_cat = [ch for ch in existing if getattr(ch.category, "id", None) == category_obj.id]
+                cat_id = category_obj.id
+                existing_in_cat = [ch for ch in existing if ch.category_id == cat_id]
                 channel_obj = existing_in_cat[0] if existing_in_cat else (existing[0] if existing else None)
             except Exception:
                 channel_obj = None
             if channel_obj is None:
                 try:
                     channel_obj = await guild.create_text_channel(
-                        name=chan_sanitized, category=category_obj, reason=f"Vyxen quarantine by {author_id}"
+                        name=chan_sanitized, category=category_obj, reason=reason
                     )
                 except Exception as exc:
                     self.tool_breaker.record_failure(str(exc))
@@ -1925,43 +1930,51 @@ class DiscordAdapter(discord.Client):
             everyone = guild.default_role
             # Hide quarantine from everyone, allow quarantine role.
             try:
+                # edit(overwrites=...) replaces the whole map, so merge into the existing overwrites.
                 ow_e_cat = category_obj.overwrites_for(everyone)
                 ow_e_cat.view_channel = False
-                await category_obj.set_permissions(everyone, overwrite=ow_e_cat, reason=f"Vyxen quarantine by {author_id}")
                 ow_r_cat = category_obj.overwrites_for(role_obj)
                 ow_r_cat.view_channel = True
-                await category_obj.set_permissions(role_obj, overwrite=ow_r_cat, reason=f"Vyxen quarantine by {author_id}")
+                cat_overwrites = dict(category_obj.overwrites)
+                cat_overwrites[everyone] = ow_e_cat
+                cat_overwrites[role_obj] = ow_r_cat
+                await category_obj.edit(overwrites=cat_overwrites, reason=reason)
 
                 ow_e = channel_obj.overwrites_for(everyone)
                 ow_e.view_channel = False
-                await channel_obj.set_permissions(everyone, overwrite=ow_e, reason=f"Vyxen quarantine by {author_id}")
                 ow_r = channel_obj.overwrites_for(role_obj)
                 ow_r.view_channel = True
                 ow_r.send_messages = True
                 ow_r.read_message_history = True
-                await channel_obj.set_permissions(role_obj, overwrite=ow_r, reason=f"Vyxen quarantine by {author_id}")
+                chan_overwrites = dict(channel_obj.overwrites)
+                chan_overwrites[everyone] = ow_e
+                chan_overwrites[role_obj] = ow_r
+                await channel_obj.edit(overwrites=chan_overwrites, reason=reason)
             except Exception as exc:
                 self.tool_breaker.record_failure(str(exc))
                 await _send_progress(f"Quarantine created, but permissions failed: {exc}")
                 return ActionResult(intent=intent, success=False, detail=f"Quarantine perms failed: {exc}")
 
-            # Deny quarantine role access everywhere else.
+            # Deny quarantine role access everywhere else. Category overwrites are not pushed to
+            # child channels by the API, so every channel needs its own standing deny; only
+            # channels where the role's own overwrite already denies view are skipped.
             denied = 0
+            skip_ids = {category_obj.id, channel_obj.id}
             for ch in guild.channels:
-                if ch.id in {category_obj.id, channel_obj.id}:
+                if ch.id in skip_ids:
                     continue
                 try:
                     ow = ch.overwrites_for(role_obj)
                     if ow.view_channel is not False:
                         ow.view_channel = False
-                        await ch.set_permissions(role_obj, overwrite=ow, reason=f"Vyxen quarantine by {author_id}")
+                        await ch.set_permissions(role_obj, overwrite=ow, reason=reason)
                         denied += 1
                 except Exception:
                     continue
 
             try:
                 if role_obj not in member.roles:
-                    await member.add_roles(role_obj, reason=f"Vyxen quarantine by {author_id}")
+                    await member.add_roles(role_obj, reason=reason)
             except Exception as exc:
                 self.tool_breaker.record_failure(str(exc))
                 await _send_progress(f"Quarantine created, but I couldn’t assign the role: {exc}")
@@ -1989,15 +2002,7 @@ class DiscordAdapter(discord.Client):
                 return ActionResult(intent=intent, success=False, detail="No category specified")
 
             category_obj = None
-            try:
-                category_obj = discord.utils.get(guild.categories, name=category_name)
-            except Exception:
-                category_obj = None
-            if category_obj is None:
-                for cat in guild.categories:
-                    if cat.name.lower() == category_name.lower():
-                        category_obj = cat
-                        break
+            category_obj = _find_by_name(guild.categories, category_name)
             if category_obj is None:
                 await _send_progress(f"Couldn’t find a category named `{category_name}`.")
                 return ActionResult(intent=intent, success=False, detail="Category not found")
@@ -2051,37 +2056,16 @@ class DiscordAdapter(discord.Client):
                 return ActionResult(intent=intent, success=False, detail="No category specified")
 
             category_obj = None
-            try:
-                category_obj = discord.utils.get(guild.categories, name=category_name)
-            except Exception:
-                category_obj = None
-            if category_obj is None:
-                for cat in guild.categories:
-                    if cat.name.lower() == category_name.lower():
-                        category_obj = cat
-                        break
+            category_obj = _find_by_name(guild.categories, category_name)
             if category_obj is None:
                 await _send_progress(f"Couldn’t find a category named `{category_name}`.")
                 return ActionResult(intent=intent, success=False, detail="Category not found")
 
-            role_obj = None
-            if role_id is not None:
-                try:
-                    role_obj = guild.get_role(int(role_id))
-                except Exception:
-                    role_obj = None
+            role_obj = guild.get_role(int(role_id)) if role_id is not None else None
             if role_obj is None:
                 role_name = (requested_changes.get("role_name") or "").strip()
                 if role_name:
-                    try:
-                        role_obj = discord.utils.get(guild.roles, name=role_name)
-                    except Exception:
-                        role_obj = None
-                    if role_obj is None:
-                        for r in guild.roles:
-                            if r.name.lower() == role_name.lower():
-                                role_obj = r
-                                break
+                    role_obj = _find_by_name(guild.roles, role_name)
             if role_obj is None:
                 await _send_progress("Which role should be allowed? Mention it like @Admin (or quote the role name).")
                 return ActionResult(intent=intent, success=False, detail="Role not found")
@@ -2097,71 +2081,55 @@ class DiscordAdapter(discord.Client):
             changed = 0
             cleared = 0
             before_map: dict[int, dict[int, dict]] = {}
+            reason = f"Vyxen lock category by {author_id}"
+            excluded = {everyone.id, role_obj.id}
+
+            async def _set_view(ch, target, ow, value: bool) -> None:
+                # Only overwrites that actually changed are recorded for undo.
+                before = self._serialize_overwrites(ow)
+                ow.view_channel = value
+                await ch.set_permissions(target, overwrite=ow, reason=reason)
+                before_map.setdefault(ch.id, {})[target.id] = before
+
+            async def _deny_other_roles(ch) -> int:
+                role_items = [
+                    (t, ow)
+                    for t, ow in (ch.overwrites or {}).items()
+                    if isinstance(t, discord.Role) and t.id not in excluded and ow.view_channel is True
+                ]
+                results = await asyncio.gather(
+                    *[_set_view(ch, t, ow, False) for t, ow in role_items], return_exceptions=True
+                )
+                failed = [(t, res) for (t, _), res in zip(role_items, results) if isinstance(res, BaseException)]
+                for target, exc in failed:
+                    self.logger.warning("Lock category: couldn't deny %s in %s: %s", target, ch, exc)
+                return len(results) - len(failed)
+
             try:
                 ow_everyone = category_obj.overwrites_for(everyone)
-                before_map[category_obj.id] = before_map.get(category_obj.id, {})
-                before_map[category_obj.id][everyone.id] = self._serialize_overwrites(ow_everyone)
                 if ow_everyone.view_channel is not False:
-                    ow_everyone.view_channel = False
-                    await category_obj.set_permissions(
-                        everyone, overwrite=ow_everyone, reason=f"Vyxen lock category by {author_id}"
-                    )
+                    await _set_view(category_obj, everyone, ow_everyone, False)
                     changed += 1
 
                 ow_admin = category_obj.overwrites_for(role_obj)
-                before_map[category_obj.id][role_obj.id] = self._serialize_overwrites(ow_admin)
                 if ow_admin.view_channel is not True:
-                    ow_admin.view_channel = True
-                    await category_obj.set_permissions(
-                        role_obj, overwrite=ow_admin, reason=f"Vyxen lock category by {author_id}"
-                    )
+                    await _set_view(category_obj, role_obj, ow_admin, True)
                     changed += 1
 
                 if strict:
-                    for target, ow in (category_obj.overwrites or {}).items():
-                        if not isinstance(target, discord.Role):
-                            continue
-                        if target.id in {everyone.id, role_obj.id}:
-                            continue
-                        before_map[category_obj.id][target.id] = self._serialize_overwrites(ow)
-                        if ow.view_channel is True:
-                            ow.view_channel = False
-                            await category_obj.set_permissions(
-                                target, overwrite=ow, reason=f"Vyxen lock category by {author_id}"
-                            )
-                            cleared += 1
+                    cleared += await _deny_other_roles(category_obj)
 
                 # Apply the same visibility rules to channels under the category.
                 for ch in list(getattr(category_obj, "channels", []) or []):
                     try:
                         ow_e = ch.overwrites_for(everyone)
-                        before_map[ch.id] = before_map.get(ch.id, {})
-                        before_map[ch.id][everyone.id] = self._serialize_overwrites(ow_e)
                         if ow_e.view_channel is not False:
-                            ow_e.view_channel = False
-                            await ch.set_permissions(
-                                everyone, overwrite=ow_e, reason=f"Vyxen lock category by {author_id}"
-                            )
+                            await _set_view(ch, everyone, ow_e, False)
                         ow_r = ch.overwrites_for(role_obj)
-                        before_map[ch.id][role_obj.id] = self._serialize_overwrites(ow_r)
                         if ow_r.view_channel is not True:
-                            ow_r.view_channel = True
-                            await ch.set_permissions(
-                                role_obj, overwrite=ow_r, reason=f"Vyxen lock category by {author_id}"
-                            )
+                            await _set_view(ch, role_obj, ow_r, True)
                         if strict:
-                            for target, ow in (ch.overwrites or {}).items():
-                                if not isinstance(target, discord.Role):
-                                    continue
-                                if target.id in {everyone.id, role_obj.id}:
-                                    continue
-                                before_map[ch.id][target.id] = self._serialize_overwrites(ow)
-                                if ow.view_channel is True:
-                                    ow.view_channel = False
-                                    await ch.set_permissions(
-                                        target, overwrite=ow, reason=f"Vyxen lock category by {author_id}"
-                                    )
-                                    cleared += 1
+                            cleared += await _deny_other_roles(ch)
                     except Exception:
                         continue
 
@@ -2185,6 +2153,16 @@ class DiscordAdapter(discord.Client):
                 )
             except Exception as exc:
                 self.tool_breaker.record_failure(str(exc))
+                if before_map and not is_dry_run:
+                    # Some overwrites landed before the failure; keep them undoable.
+                    self._record_action_journal(
+                        author_id,
+                        intent_type,
+                        {"category_id": category_obj.id, "role_id": role_obj.id},
+                        {"overwrites": before_map},
+                        {"locked": False, "partial": True},
+                        reversible=True,
+                    )
                 await _send_progress(f"Couldn’t lock that category: {exc}")
                 return ActionResult(intent=intent, success=False, detail=f"Lock category failed: {exc}")
 
@@ -2200,11 +2178,12 @@ class DiscordAdapter(discord.Client):
                 name = re.sub(r"-{2,}", "-", name).strip("-")
                 return name or "channel"
 
-            category_name = requested_changes.get("category_name")
-            channel_name = requested_changes.get("channel_name")
-            role_name = requested_changes.get("role_name")
+            category_name = _name_arg(requested_changes, "category_name")
+            channel_name = _name_arg(requested_changes, "channel_name")
+            role_name = _name_arg(requested_changes, "role_name")
             channel_type = requested_changes.get("channel_type")
             perm_spec = requested_changes.get("permissions") or {}
+            reason = f"Vyxen admin request by {author_id}"
 
             await _send_progress(
                 f"Okay—working on it. I’m going to create what you asked for{(' (category/channel/role)' if intent_type in {'bulk_setup','server_setup'} else '')}."
@@ -2213,26 +2192,17 @@ class DiscordAdapter(discord.Client):
             category_obj = None
             category_created = False
             if category_name and intent_type in {"bulk_setup", "server_setup", "create_category", "create_text_channel", "create_voice_channel"}:
-                category_name_clean = str(category_name).strip()[:90]
-                try:
-                    category_obj = discord.utils.get(guild.categories, name=category_name_clean)
-                except Exception:
-                    category_obj = None
-                if category_obj is None:
-                    for cat in guild.categories:
-                        if cat.name.lower() == category_name_clean.lower():
-                            category_obj = cat
-                            break
+                category_obj = _find_by_name(guild.categories, category_name)
                 if category_obj is None:
                     try:
                         category_obj = await guild.create_category(
-                            name=category_name_clean,
-                            reason=f"Vyxen admin request by {author_id}",
+                            name=category_name,
+                            reason=reason,
                         )
                         category_created = True
                     except Exception as exc:
                         self.tool_breaker.record_failure(str(exc))
-                        await _send_progress(f"Couldn’t create category `{category_name_clean}`: {exc}")
+                        await _send_progress(f"Couldn’t create category `{category_name}`: {exc}")
                         return ActionResult(intent=intent, success=False, detail=f"Create category failed: {exc}")
 
             channel_obj = None
@@ -2240,13 +2210,11 @@ class DiscordAdapter(discord.Client):
             if channel_name and intent_type in {"bulk_setup", "server_setup", "create_text_channel", "create_voice_channel"}:
                 wants_voice = (channel_type == "voice") or (intent_type == "create_voice_channel")
                 if wants_voice:
-                    voice_name = str(channel_name).strip()[:90]
                     try:
-                        existing = [ch for ch in guild.voice_channels if ch.name.lower() == voice_name.lower()]
+                        existing = [ch for ch in guild.voice_channels if ch.name.lower() == channel_name.lower()]
                         if category_obj is not None:
-                            existing_in_cat = [
-                                ch for ch in existing if getattr(ch.category, "id", None) == category_obj.id
-                            ]
+                            cat_id = category_obj.id
+                            existing_in_cat = [ch for ch in existing if ch.category_id == cat_id]
                             channel_obj = existing_in_cat[0] if existing_in_cat else (existing[0] if existing else None)
                         else:
                             channel_obj = existing[0] if existing else None
@@ -2256,23 +2224,22 @@ class DiscordAdapter(discord.Client):
                     if channel_obj is None:
                         try:
                             channel_obj = await guild.create_voice_channel(
-                                name=voice_name,
+                                name=channel_name,
                                 category=category_obj,
-                                reason=f"Vyxen admin request by {author_id}",
+                                reason=reason,
                             )
                             channel_created = True
                         except Exception as exc:
                             self.tool_breaker.record_failure(str(exc))
-                            await _send_progress(f"Couldn’t create voice channel `{voice_name}`: {exc}")
+                            await _send_progress(f"Couldn’t create voice channel `{channel_name}`: {exc}")
                             return ActionResult(intent=intent, success=False, detail=f"Create voice channel failed: {exc}")
                 else:
-                    sanitized = _sanitize_channel_name(str(channel_name))
+                    sanitized = _sanitize_channel_name(channel_name)
                     try:
                         existing = [ch for ch in guild.text_channels if ch.name == sanitized]
                         if category_obj is not None:
-                            existing_in_cat = [
-                                ch for ch in existing if getattr(ch.category, "id", None) == category_obj.id
-                            ]
+                            cat_id = category_obj.id
+                            existing_in_cat = [ch for ch in existing if ch.category_id == cat_id]
                             channel_obj = existing_in_cat[0] if existing_in_cat else (existing[0] if existing else None)
                         else:
                             channel_obj = existing[0] if existing else None
@@ -2284,7 +2251,7 @@ class DiscordAdapter(discord.Client):
                             channel_obj = await guild.create_text_channel(
                                 name=sanitized,
                                 category=category_obj,
-                                reason=f"Vyxen admin request by {author_id}",
+                                reason=reason,
                             )
                             channel_created = True
                         except Exception as exc:
@@ -2295,51 +2262,32 @@ class DiscordAdapter(discord.Client):
             role_obj = None
             role_created = False
             if role_name and intent_type in {"bulk_setup", "server_setup", "create_role"}:
-                role_name_clean = str(role_name).strip()[:90]
-                try:
-                    role_obj = discord.utils.get(guild.roles, name=role_name_clean)
-                except Exception:
-                    role_obj = None
-                if role_obj is None:
-                    for r in guild.roles:
-                        if r.name.lower() == role_name_clean.lower():
-                            role_obj = r
-                            break
+                role_obj = _find_by_name(guild.roles, role_name)
                 if role_obj is None:
                     try:
                         role_obj = await guild.create_role(
-                            name=role_name_clean,
-                            reason=f"Vyxen admin request by {author_id}",
+                            name=role_name,
+                            reason=reason,
                         )
                         role_created = True
                     except Exception as exc:
                         self.tool_breaker.record_failure(str(exc))
-                        await _send_progress(f"Couldn’t create role `{role_name_clean}`: {exc}")
+                        await _send_progress(f"Couldn’t create role `{role_name}`: {exc}")
                         return ActionResult(intent=intent, success=False, detail=f"Create role failed: {exc}")
 
+            valid_perms = {
+                k: (None if v is None else bool(v))
+                for k, v in perm_spec.items()
+                if isinstance(k, str) and k in discord.Permissions.VALID_FLAGS
+            }
             if perm_spec and role_obj and channel_obj:
                 try:
                     overwrites = channel_obj.overwrites_for(role_obj)
-                    applied_allow: list[str] = []
-                    applied_deny: list[str] = []
-                    applied_clear: list[str] = []
-                    for perm_name, perm_value in perm_spec.items():
-                        if not isinstance(perm_name, str) or not hasattr(overwrites, perm_name):
-                            continue
-                        if perm_value is None:
-                            setattr(overwrites, perm_name, None)
-                            applied_clear.append(perm_name)
-                        elif isinstance(perm_value, bool):
-                            setattr(overwrites, perm_name, perm_value)
-                            (applied_allow if perm_value else applied_deny).append(perm_name)
-                        else:
-                            coerced = bool(perm_value)
-                            setattr(overwrites, perm_name, coerced)
-                            (applied_allow if coerced else applied_deny).append(perm_name)
+                    overwrites.update(**valid_perms)
                     await channel_obj.set_permissions(
                         role_obj,
                         overwrite=overwrites,
-                        reason=f"Vyxen admin request by {author_id}",
+                        reason=reason,
                     )
                 except Exception as exc:
                     self.tool_breaker.record_failure(str(exc))
@@ -2360,14 +2308,11 @@ class DiscordAdapter(discord.Client):
                     f"Role: `{role_obj.name}`" + ("" if role_created else " (existing)")
                 )
             if perm_spec and role_obj and channel_obj:
-                allow_list = [k for k, v in perm_spec.items() if v is True]
-                deny_list = [k for k, v in perm_spec.items() if v is False]
-                clear_list = [k for k, v in perm_spec.items() if v is None]
-
-                def _clip(items: list[str], limit: int = 6) -> str:
-                    if len(items) <= limit:
-                        return ", ".join(items)
-                    return ", ".join(items[:limit]) + f", +{len(items) - limit}"
+                allow_list: list[str] = []
+                deny_list: list[str] = []
+                clear_list: list[str] = []
+                for k, v in valid_perms.items():
+                    (allow_list if v is True else deny_list if v is False else clear_list).append(k)
 
                 perm_parts: list[str] = []
                 if allow_list:
@@ -2378,74 +2323,170 @@ class DiscordAdapter(discord.Client):
                     perm_parts.append(f"clear: {_clip(clear_list)}")
                 parts.append("Permissions: " + ("; ".join(perm_parts) if perm_parts else "set overwrites"))
 
-            await _send_progress("Done. " + (" | ".join(parts) if parts else "No changes were needed."))
+            if parts:
+                progress_summary = " | ".join(parts)
+                detail_summary = "; ".join(parts)
+            else:
+                progress_summary = "No changes were needed."
+                detail_summary = "No-op"
+            await _send_progress(f"Done. {progress_summary}")
             self.tool_breaker.record_success()
             if not is_dry_run:
+                cat_id = category_obj.id if category_obj else None
+                chan_id = channel_obj.id if channel_obj else None
+                role_id = role_obj.id if role_obj else None
                 if category_created:
                     self._record_action_journal(
                         author_id,
                         "create_category",
-                        {"category_id": category_obj.id if category_obj else None, "name": category_obj.name if category_obj else category_name},
+                        {"category_id": cat_id, "name": category_obj.name if category_obj else category_name},
                         None,
-                        {"category_id": category_obj.id if category_obj else None},
+                        {"category_id": cat_id},
                         reversible=True,
                     )
                 if channel_created and channel_obj is not None:
+                    channel_kind = "voice" if wants_voice else "text"
                     self._record_action_journal(
                         author_id,
-                        "create_voice_channel" if wants_voice else "create_text_channel",
-                        {"channel_id": channel_obj.id, "name": channel_obj.name},
+                        f"create_{channel_kind}_channel",
+                        {"channel_id": chan_id, "name": channel_obj.name},
                         None,
-                        {"channel_id": channel_obj.id, "type": "voice" if wants_voice else "text", "category_id": getattr(channel_obj, "category_id", None)},
+                        {"channel_id": chan_id, "type": channel_kind, "category_id": getattr(channel_obj, "category_id", None)},
                         reversible=True,
                     )
                 if role_created and role_obj is not None:
                     self._record_action_journal(
                         author_id,
                         "create_role",
-                        {"role_id": role_obj.id, "name": role_obj.name},
+                        {"role_id": role_id, "name": role_obj.name},
                         None,
-                        {"role_id": role_obj.id, "permissions": role_obj.permissions.value},
+                        {"role_id": role_id, "permissions": role_obj.permissions.value},
                         reversible=True,
                     )
-            return ActionResult(intent=intent, success=True, detail="; ".join(parts) if parts else "No-op")
+            return ActionResult(intent=intent, success=True, detail=detail_summary)
 
         return ActionResult(intent=intent, success=False, detail="Unsupported tool intent")
 
     async def _enqueue_stimulus(self, stimulus: Stimulus) -> None:
-        try:
-            self.stimulus_queue.put_nowait(stimulus)
-        except asyncio.QueueFull:
-            self.logger.warning("Stimulus queue full; dropping %s", stimulus.type)
+        self._enqueue_stimuli((stimulus,))
+
+    def _enqueue_stimuli(self, stimuli) -> None:
+        """
+        Enqueue a message's stimuli in one go; the cognition loop drains the queue per tick.
+        """
+        put = self._put_stim
+        for idx, stimulus in enumerate(stimuli):
+            try:
+                put(stimulus)
+            except asyncio.QueueFull:
+                self.logger.warning(
+                    "Stimulus queue full; dropping %d stimuli starting with %s", len(stimuli) - idx, stimulus.type
+                )
+                return
 
     async def _get_channel(self, channel_id: Optional[int]) -> Optional[discord.TextChannel]:
         if channel_id is None:
             return None
         channel = self.get_channel(channel_id)
-        if channel is None:
-            try:
-                channel = await self.fetch_channel(channel_id)
-            except Exception as exc:
-                print(f"[ACTION-ERROR] fetch_channel failed for {channel_id}: {exc}")
-                return None
+        if channel is not None:
+            return channel
+        now = time.monotonic()
+        cached = self._channel_cache.get(channel_id)
+        if cached is not None:
+            if cached[0] > now:
+                return cached[1]
+            del self._channel_cache[channel_id]
+        try:
+            channel = await self.fetch_channel(channel_id)
+        except Exception as exc:
+            print(f"[ACTION-ERROR] fetch_channel failed for {channel_id}: {exc}")
+            return None
+        self._channel_cache[channel_id] = (now + self._channel_cache_ttl, channel)
+        if len(self._channel_cache) > self._channel_cache_limit:
+            # FIFO trim: dicts keep insertion order, so the first key is the oldest.
+            self._channel_cache.pop(next(iter(self._channel_cache)))
         return channel
 
     def _can_send(self, channel: discord.TextChannel) -> bool:
-        me = channel.guild.me if channel.guild else None
+        guild = channel.guild
+        if not guild:
+            return True
+        key = (guild.id, channel.id)
+        cached = self._send_perm_cache.get(key)
+        if cached is not None:
+            return cached
+        me = guild.me
         if not me:
             return True
-        perms = channel.permissions_for(me)
-        return perms.send_messages
+        allowed = bool(channel.permissions_for(me).value & _SEND_MESSAGES_FLAG)
+        self._send_perm_cache[key] = allowed
+        return allowed
 
     def _calculate_salience(self, message: discord.Message) -> float:
-        salience = 0.4
-        if self.user and self.user in message.mentions:
-            salience += 0.3
-        if message.attachments:
-            salience += 0.2
-        if len(message.content) > 150:
-            salience += 0.1
-        return min(1.0, salience)
+        user = self.user
+        salience = (
+            0.4
+            + (0.3 if user is not None and user in message.mentions else 0.0)
+            + (0.2 if message.attachments else 0.0)
+            + (0.1 if len(message.content) > 150 else 0.0)
+        )
+        return salience if salience < 1.0 else 1.0
+
+
+def _install_uvloop() -> bool:
+    """
+    Use uvloop's event loop policy when it is installed (non-Windows only).
+    Must run before asyncio.run() so the loop and queues are created on uvloop.
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop  # type: ignore
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+_DIAG_LOG_LIMIT = 1024
+_diag_log_queue: "queue.Queue[str]" = queue.Queue(maxsize=_DIAG_LOG_LIMIT)
+_diag_log_thread: Optional[threading.Thread] = None
+
+
+def _diag_log_writer() -> None:
+    while True:
+        line = _diag_log_queue.get()
+        try:
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
+        except Exception:
+            pass
+
+
+def _diag_log(line: str) -> None:
+    """
+    Hand a diagnostic line to a daemon writer thread so a slow stdout never blocks the loop.
+    Lines are dropped once the queue holds _DIAG_LOG_LIMIT pending entries.
+    """
+    global _diag_log_thread
+    if _diag_log_thread is None:
+        _diag_log_thread = threading.Thread(target=_diag_log_writer, name="vyxen-diag-log", daemon=True)
+        _diag_log_thread.start()
+    try:
+        _diag_log_queue.put_nowait(line)
+    except queue.Full:
+        pass
+
+
+def _rss_mb() -> float:
+    """
+    Current RSS from /proc/self/statm; falls back to peak RSS (ru_maxrss) off Linux.
+    """
+    try:
+        with open("/proc/self/statm", "rb") as fh:
+            return int(fh.read().split()[1]) * resource.getpagesize() / (1024 * 1024)
+    except Exception:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
 
 
 async def main() -> None:
@@ -2453,12 +2494,12 @@ async def main() -> None:
     if not token:
         raise RuntimeError("DISCORD_TOKEN environment variable required.")
 
-    pre_mem = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
-    print(f"[MEMDBG] start main: {pre_mem:.1f} MB", flush=True)
+    pre_mem = _rss_mb()
+    _diag_log(f"[MEMDBG] start main: {pre_mem:.1f} MB")
 
     config = RuntimeConfig.from_env()
-    stimulus_queue: asyncio.Queue = asyncio.Queue(maxsize=config.stimulus_queue_limit)
-    action_queue: asyncio.Queue = asyncio.Queue(maxsize=config.action_queue_limit)
+    stimulus_queue = FastAsyncQueue(maxsize=config.stimulus_queue_limit)
+    action_queue = FastAsyncQueue(maxsize=config.action_queue_limit)
 
     state = InternalState(safe_mode=config.safe_mode_default)
     memory = CausalMemory(config, allow_writes=not config.safe_mode_default)
@@ -2483,102 +2524,167 @@ async def main() -> None:
         action_queue=action_queue,
     )
 
-    mid_mem = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
-    print(f"[MEMDBG] post-setup: {mid_mem:.1f} MB", flush=True)
+    mid_mem = _rss_mb()
+    _diag_log(f"[MEMDBG] post-setup: {mid_mem:.1f} MB")
+
+    # Cognition runs alongside the adapter; a crash in either background task cancels the
+    # group and surfaces as an ExceptionGroup to the caller instead of being swallowed.
+    async with asyncio.TaskGroup() as tg:
+        cognition_task = tg.create_task(cognition.start(), name="cognition_loop")
+        mem_watch_task = tg.create_task(_memory_watch(state), name="memory_watch")
+        after_cog = _rss_mb()
+        _diag_log(f"[MEMDBG] after cognition start: {after_cog:.1f} MB")
+        try:
+            await adapter.start(token=token)
+        finally:
+            cognition.running = False
+            cognition_task.cancel()
+            mem_watch_task.cancel()
 
-    def _log_task_failure(task: asyncio.Task) -> None:
-        if task.cancelled():
-            return
-        exc = task.exception()
-        if exc:
-            print(f"[TASK-ERROR] {task.get_name()}: {exc}", file=sys.stderr, flush=True)
-
-    # Kick off cognition loop separately to keep running regardless of Discord events
-    cognition_task = asyncio.create_task(cognition.start(), name="cognition_loop")
-    mem_watch_task = asyncio.create_task(_memory_watch(state), name="memory_watch")
-    cognition_task.add_done_callback(_log_task_failure)
-    mem_watch_task.add_done_callback(_log_task_failure)
-    after_cog = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
-    print(f"[MEMDBG] after cognition start: {after_cog:.1f} MB", flush=True)
-    try:
-        await adapter.start(token=token)
-    finally:
-        cognition.running = False
-        cognition_task.cancel()
-        mem_watch_task.cancel()
-        await asyncio.gather(cognition_task, mem_watch_task, return_exceptions=True)
+
+_TRUTHY_VALUES = frozenset(("1", "true", "yes", "on"))
 
 
 def _env_truthy(key: str, default: bool = False) -> bool:
-    val = os.getenv(key)
-    if val is None:
-        return default
-    val = val.strip().lower()
-    if not val:
+    if not (val := (os.getenv(key) or "").strip().lower()):
         return default
-    return val in {"1", "true", "yes", "on"}
+    return val in _TRUTHY_VALUES
 
 
-async def _memory_watch(state: InternalState, interval: float = 1.0, probe_threshold_mb: float = 600.0) -> None:
-    enable_tracemalloc = _env_truthy("VYXEN_MEMWATCH_TRACEMALLOC", default=False)
+def _source_line(filename: str, lineno: int) -> str:
     try:
-        import tracemalloc  # type: ignore
+        return (linecache.getline(filename, lineno) or "").strip()
+    except Exception:
+        return ""
+
+
+def _source_lines(sites: list[tuple[str, int]]) -> list[str]:
+    """
+    Resolve a batch of (filename, lineno) sites; run in an executor since linecache may open files.
+    """
+    linecache.checkcache()
+    return [_source_line(filename, lineno) for filename, lineno in sites]
+
+
+async def _memory_watch(
+    state: InternalState,
+    interval: float = 5.0,
+    probe_threshold_mb: float = 600.0,
+    max_interval: float = 60.0,
+    probe_step_mb: float = 50.0,
+) -> None:
+    """
+    Periodically sample RSS. The interval backs off while RSS is stable and drops to 1s
+    once RSS approaches the probe threshold.
+
+    Past the threshold, every new high-water mark (probe_step_mb apart) triggers a probe.
+    With tracemalloc enabled, successive snapshots are diffed and allocation sites are
+    ranked by a Laplace-smoothed growth ratio, (growth + 1) / (growth + shrink + 2).
+    """
+    tracemalloc = None
+    if _env_truthy("VYXEN_MEMWATCH_TRACEMALLOC", default=False):
+        try:
+            import tracemalloc  # type: ignore
 
-        if enable_tracemalloc:
             tracemalloc.start()
-    except Exception:
-        tracemalloc = None  # type: ignore
+        except Exception:
+            tracemalloc = None  # type: ignore
     try:
         import faulthandler
     except Exception:
         faulthandler = None  # type: ignore
-    logged = False
-    last_reported = 0.0
-    while True:
-        try:
-            await asyncio.sleep(interval)
-        except asyncio.CancelledError:
-            return
-        try:
-            with open("/proc/self/statm", "r") as fh:
-                parts = fh.read().split()
-                rss_pages = int(parts[1]) if len(parts) > 1 else 0
-                rss_mb = rss_pages * (resource.getpagesize() / (1024 * 1024))
-        except Exception:
+    loop = asyncio.get_running_loop()
+    base_interval = interval
+    page_mb = resource.getpagesize() / (1024 * 1024)
+    try:
+        statm_fd: Optional[int] = os.open("/proc/self/statm", os.O_RDONLY)
+    except OSError:
+        statm_fd = None
+    probe_high_water = probe_threshold_mb
+    probes = 0
+    prev_snapshot = None
+    leak_growth: Counter = Counter()
+    leak_shrink: Counter = Counter()
+    next_report_at = 0.0
+    last_rss = 0.0
+    try:
+        while True:
+            wakeup = loop.create_future()
+            timer = loop.call_later(interval, wakeup.set_result, None)
+            try:
+                await wakeup
+            except asyncio.CancelledError:
+                timer.cancel()
+                return
             try:
-                rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+                if statm_fd is None:
+                    raise OSError("statm unavailable")
+                parts = os.pread(statm_fd, 128, 0).split()
+                rss_pages = int(parts[1]) if len(parts) > 1 else 0
+                rss_mb = rss_pages * page_mb
             except Exception:
-                continue
-        if rss_mb - last_reported >= 50:
-            last_reported = rss_mb
-            print(f"[MEMWATCH] rss={rss_mb:.1f} MB safe_mode={state.safe_mode}", flush=True)
-        if rss_mb > probe_threshold_mb and not logged:
-            logged = True
-            print(f"[MEMPROBE] rss={rss_mb:.1f} MB safe_mode={state.safe_mode}", flush=True)
-            if faulthandler is not None:
                 try:
-                    faulthandler.dump_traceback(file=sys.stdout)
+                    rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
                 except Exception:
-                    pass
-                if tracemalloc and getattr(tracemalloc, "is_tracing", lambda: False)():
-                    snapshot = tracemalloc.take_snapshot()
-                    stats = snapshot.statistics("lineno")[:6]
-                    for stat in stats:
-                        frame = stat.traceback[0]
-                        line_src = getattr(frame, "line", None)
-                        if line_src is None:
-                            try:
-                                import linecache
-
-                                line_src = (linecache.getline(frame.filename, frame.lineno) or "").strip()
-                            except Exception:
-                                line_src = ""
-                        else:
-                            line_src = line_src.strip()
-                        print(
-                            f"[MEMPROBE] {stat.size / 1024:.1f} KB @ {frame.filename}:{frame.lineno} {line_src}",
-                            flush=True,
+                    continue
+            if rss_mb > 0.8 * probe_threshold_mb:
+                interval = 1.0
+            elif abs(rss_mb - last_rss) < 5.0:
+                interval = min(max_interval, interval * 1.5)
+            else:
+                interval = base_interval
+            last_rss = rss_mb
+            if rss_mb >= next_report_at:
+                next_report_at = rss_mb + 50.0
+                _diag_log(f"[MEMWATCH] rss={rss_mb:.1f} MB safe_mode={state.safe_mode} audit_dropped={audit_dropped()}")
+            if rss_mb > probe_high_water:
+                probe_high_water = rss_mb + probe_step_mb
+                _diag_log(f"[MEMPROBE] rss={rss_mb:.1f} MB safe_mode={state.safe_mode}")
+                if probes == 0 and faulthandler is not None:
+                    try:
+                        faulthandler.dump_traceback(file=sys.stdout)
+                    except Exception:
+                        pass
+                probes += 1
+                if tracemalloc is not None and tracemalloc.is_tracing():
+                    snapshot = tracemalloc.take_snapshot().filter_traces(
+                        (
+                            tracemalloc.Filter(True, "*/vyxen_core/*"),
+                            tracemalloc.Filter(True, "*/discord_adapter.py"),
                         )
+                    )
+                    if prev_snapshot is None:
+                        top_stats = snapshot.statistics("lineno")[:6]
+                        sites = [(stat.traceback[0].filename, stat.traceback[0].lineno) for stat in top_stats]
+                        sources = await loop.run_in_executor(None, _source_lines, sites)
+                        for stat, (filename, lineno), source in zip(top_stats, sites, sources):
+                            _diag_log(f"[MEMPROBE] {stat.size / 1024:.1f} KB @ {filename}:{lineno} {source}")
+                    else:
+                        for stat in snapshot.compare_to(prev_snapshot, "lineno")[:16]:
+                            frame = stat.traceback[0]
+                            site = (frame.filename, frame.lineno)
+                            if stat.size_diff > 0:
+                                leak_growth[site] += 1
+                            elif stat.size_diff < 0:
+                                leak_shrink[site] += 1
+
+                        def _leak_score(site: tuple[str, int]) -> float:
+                            grown = leak_growth[site]
+                            return (grown + 1) / (grown + leak_shrink[site] + 2)
+
+                        sites = sorted(leak_growth, key=_leak_score, reverse=True)[:3]
+                        sources = await loop.run_in_executor(None, _source_lines, sites)
+                        for site, source in zip(sites, sources):
+                            filename, lineno = site
+                            _diag_log(
+                                f"[MEMPROBE] leak_score={_leak_score(site):.2f} growth={leak_growth[site]} "
+                                f"shrink={leak_shrink[site]} @ {filename}:{lineno} {source}"
+                            )
+                    prev_snapshot = snapshot
+    finally:
+        if statm_fd is not None:
+            os.close(statm_fd)
 
 if __name__ == "__main__":
+    _install_uvloop()
     asyncio.run(main())
@@ -1,3 +1,5 @@
+import pytest
+
 from vyxen_core.action_journal import ActionJournal
 
 
@@ -22,3 +24,47 @@ def test_pop_last_reversible():
     assert entry is not None
     assert entry.action_type == "create_role"
     assert journal.pop_last_reversible("user") is None
+
+
+def test_action_journal_accepts_int_and_str_user_ids():
+    journal = ActionJournal()
+    journal.record(123456789012345678, "create_role", {"role_id": 1}, None, {"role_id": 1}, True)
+    entry = journal.last("123456789012345678")
+    assert entry is not None
+    assert entry.user_id == 123456789012345678
+
+
+def test_action_entry_wall_time_tracks_clock():
+    import time
+
+    from vyxen_core.action_journal import wall_time
+
+    journal = ActionJournal()
+    entry = journal.record("1", "create_role", {"role_id": 1}, None, {"role_id": 1}, True)
+    assert isinstance(entry.timestamp, int)
+    assert abs(wall_time(entry) - time.time()) < 5
+
+
+def test_reversible_index_follows_eviction():
+    journal = ActionJournal(max_entries_per_user=2)
+    journal.record("1", "create_role", {"role_id": 1}, None, {"role_id": 1}, True)
+    journal.record("1", "ban_member", {"member_id": 2}, None, None, False)
+    journal.record("1", "kick_member", {"member_id": 3}, None, None, False)
+    # The only reversible entry was evicted from the bounded history.
+    assert journal.last_reversible("1") is None
+    assert journal.pop_last_reversible("1") is None
+    journal.record("1", "create_channel", {"channel_id": 4}, None, {"channel_id": 4}, True)
+    entry = journal.pop_last_reversible("1")
+    assert entry is not None and entry.action_type == "create_channel"
+    assert journal.last("1").action_type == "kick_member"
+
+
+def test_recorded_states_are_read_only_snapshots():
+    journal = ActionJournal()
+    before = {"name": "Mods", "permissions": 8}
+    entry = journal.record("1", "delete_role", {"role_id": 1}, before, {}, True)
+    before["name"] = "changed"
+    assert entry.before_state["name"] == "Mods"
+    assert entry.after_state == {}
+    with pytest.raises(TypeError):
+        entry.before_state["name"] = "x"
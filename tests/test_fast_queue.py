@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+from vyxen_core.fast_queue import FastAsyncQueue
+
+
+def test_fast_queue_nowait_bounds_and_order():
+    q = FastAsyncQueue(maxsize=2)
+    q.put_nowait("a")
+    q.put_nowait("b")
+    with pytest.raises(asyncio.QueueFull):
+        q.put_nowait("c")
+    assert q.qsize() == 2
+    assert q.get_nowait() == "a"
+    assert q.get_nowait() == "b"
+    with pytest.raises(asyncio.QueueEmpty):
+        q.get_nowait()
+
+
+def test_fast_queue_get_waits_and_put_applies_backpressure():
+    async def scenario():
+        q = FastAsyncQueue(maxsize=1)
+        getter = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+        q.put_nowait(1)
+        assert await asyncio.wait_for(getter, 1) == 1
+
+        q.put_nowait(2)
+        putter = asyncio.create_task(q.put(3))
+        await asyncio.sleep(0)
+        assert not putter.done()
+        assert q.get_nowait() == 2
+        await asyncio.wait_for(putter, 1)
+        return q.get_nowait()
+
+    assert asyncio.run(scenario()) == 3
+
+
+def test_fast_queue_drain_pops_in_order_up_to_limit():
+    q = FastAsyncQueue(maxsize=3)
+    for item in "abc":
+        q.put_nowait(item)
+    assert q.drain(2) == ["a", "b"]
+    assert not q.full()
+    assert q.drain(5) == ["c"]
+    assert q.drain(5) == []
@@ -0,0 +1,42 @@
+from types import SimpleNamespace
+
+from vyxen_core import llm
+from vyxen_core.config import RuntimeConfig
+
+
+class FakeCompletions:
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, model, messages):
+        self.calls += 1
+        message = SimpleNamespace(content=f"reply {self.calls}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def test_identical_prompts_reuse_the_cached_reply(monkeypatch):
+    completions = FakeCompletions()
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    monkeypatch.setattr(llm, "_client_lazy", lambda: client)
+    monkeypatch.setattr(llm, "_reply_cache_ttl_s", 60.0)
+    monkeypatch.setattr(llm, "_reply_cache_size", 8)
+    llm._reply_cache.clear()
+    hits, misses = llm.cache_stats()
+
+    first = llm.craft_social_reply("hello", {"warmth": 0.5}, {}, [])
+    second = llm.craft_social_reply("hello", {"warmth": 0.5}, {}, [])
+    changed = llm.craft_social_reply("hello", {"warmth": 0.6}, {}, [])
+
+    assert first == second == "reply 1"
+    assert changed == "reply 2"
+    assert completions.calls == 2
+    assert llm.cache_stats() == (hits + 1, misses + 2)
+    llm._reply_cache.clear()
+
+
+def test_cache_settings_fall_back_to_defaults_on_bad_env(monkeypatch):
+    monkeypatch.setenv("VYXEN_LLM_CACHE_TTL_S", "two minutes")
+    monkeypatch.setenv("VYXEN_LLM_CACHE_SIZE", "lots")
+    config = RuntimeConfig.from_env()
+    assert config.llm_cache_ttl_s == RuntimeConfig.llm_cache_ttl_s
+    assert config.llm_cache_size == RuntimeConfig.llm_cache_size
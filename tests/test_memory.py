@@ -1,4 +1,5 @@
 import gzip
+import sqlite3
 import time
 from pathlib import Path
 
@@ -62,3 +63,79 @@ def test_memory_record_rotation_and_shared_context(tmp_path: Path):
     memory.record_shared_context("global", ["testing"], ["user1"], weight=0.5)
     shared = memory.fetch_shared_context("global", ["testing"])
     assert shared and shared[0][0] == "testing"
+
+
+def test_adjust_user_profile_only_touches_timestamp_when_nothing_moves(tmp_path: Path):
+    config = RuntimeConfig(
+        memory_path=tmp_path / "vyxen.db",
+        warm_archive_path=tmp_path / "warm_archive.jsonl.gz",
+        audit_log_path=tmp_path / "audit.log",
+        memory_max_writes_per_second=20,
+        memory_table_limits={"user_profiles": 1},
+    )
+    memory = CausalMemory(config)
+
+    def stored(user_id: str):
+        conn = sqlite3.connect(config.memory_path)
+        row = conn.execute(
+            "SELECT data, updated FROM user_profiles WHERE server_id = ? AND user_id = ?", ("s1", user_id)
+        ).fetchone()
+        conn.close()
+        return row
+
+    pinned = memory.adjust_user_profile("s1", "u1", {"verbosity": -1.0})
+    assert pinned["verbosity"] == 0.0
+    data, updated = stored("u1")
+
+    # Table is at its limit: the pinned profile's data stays put, but it must not go stale.
+    time.sleep(0.01)
+    again = memory.adjust_user_profile("s1", "u1", {"verbosity": -0.2, "unknown": 1.0})
+    assert again["verbosity"] == 0.0
+    touched_data, touched = stored("u1")
+    assert touched_data == data
+    assert touched > updated
+
+    memory.adjust_user_profile("s1", "u2", {"verbosity": 0.25})
+    assert stored("u2") is None
+
+
+def test_write_batch_commits_writes_together(tmp_path: Path):
+    config = RuntimeConfig(
+        memory_path=tmp_path / "vyxen.db",
+        warm_archive_path=tmp_path / "warm_archive.jsonl.gz",
+        audit_log_path=tmp_path / "audit.log",
+        memory_max_writes_per_second=20,
+    )
+    memory = CausalMemory(config)
+
+    with memory.write_batch():
+        memory.save_important("s1", "u1", "preferred_name", "Vee", weight=0.8)
+        memory.save_important("s1", "u1", "communication", "prefers concise", weight=0.7)
+        # Not committed yet, so a separate connection sees nothing.
+        assert memory.get_important("s1", "u1") == {}
+
+    important = memory.get_important("s1", "u1")
+    assert important["preferred_name"]["value"] == "Vee"
+    assert important["communication"]["value"] == "prefers concise"
+
+
+def test_write_batch_opens_no_connection_until_a_write(tmp_path: Path, monkeypatch):
+    config = RuntimeConfig(
+        memory_path=tmp_path / "vyxen.db",
+        warm_archive_path=tmp_path / "warm_archive.jsonl.gz",
+        audit_log_path=tmp_path / "audit.log",
+    )
+    memory = CausalMemory(config)
+    opened = []
+    open_conn = memory._open_conn
+    monkeypatch.setattr(memory, "_open_conn", lambda: opened.append(1) or open_conn())
+
+    with memory.write_batch():
+        pass
+    assert opened == []
+
+    with memory.write_batch():
+        memory.save_important("s1", "u1", "pronouns", "they/them", weight=0.8)
+        memory.save_important("s1", "u1", "likes", "cats", weight=0.6)
+    assert opened == [1]
+    assert memory.get_important("s1", "u1")["likes"]["value"] == "cats"
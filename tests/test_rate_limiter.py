@@ -14,7 +14,7 @@ def test_rate_limiter_blocks_burst_and_recovers():
     assert not limiter.allow(key)  # burst threshold hit
 
     # Simulate time passing to clear the burst window
-    limiter.actions[key] = [time.time() - 10]
+    limiter.actions[key] = [time.monotonic() - 10]
     assert limiter.allow(key)
 
 
@@ -29,5 +29,45 @@ def test_rate_limiter_enforces_per_minute_cap():
     assert not limiter.allow(key)  # per-minute limit reached
 
     # Drop old timestamps to allow again
-    limiter.actions[key] = [time.time() - 61]
+    limiter.actions[key] = [time.monotonic() - 61]
     assert limiter.allow(key)
+
+
+def test_rate_limiter_drops_expired_history_from_head():
+    config = RuntimeConfig(max_actions_per_minute=2, action_burst=5)
+    limiter = RateLimiter(config)
+    key = "react:channel"
+
+    now = time.monotonic()
+    limiter.actions[key] = [now - 120, now - 90, now - 30]
+    assert limiter.allow(key)
+    assert list(limiter.actions[key])[0] == now - 30
+    assert len(limiter.actions[key]) == 2
+    assert not limiter.allow(key)
+
+
+def test_rate_limiter_evicts_least_recently_used_keys():
+    limiter = RateLimiter(RuntimeConfig(max_actions_per_minute=10, action_burst=5), max_keys=2)
+    assert limiter.allow("a")
+    assert limiter.allow("b")
+    assert limiter.allow("a")
+    assert limiter.allow("c")
+    assert list(limiter.actions) == ["a", "c"]
+
+
+def test_rate_limiter_sweeps_idle_keys():
+    limiter = RateLimiter(RuntimeConfig(max_actions_per_minute=10, action_burst=5))
+    now = time.monotonic()
+    limiter.actions["idle"] = [now - 120]
+    limiter.actions["empty"] = []
+    limiter.actions["busy"] = [now - 1]
+    limiter._last_sweep = now - 61
+    assert limiter.allow("new")
+    assert set(limiter.actions) == {"busy", "new"}
+
+
+def test_rate_limiter_accepts_caller_clock():
+    limiter = RateLimiter(RuntimeConfig(max_actions_per_minute=1, action_burst=5))
+    assert limiter.allow("k", now=1000.0)
+    assert not limiter.allow("k", now=1030.0)
+    assert limiter.allow("k", now=1061.0)
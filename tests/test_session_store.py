@@ -157,3 +157,39 @@ def test_session_switches_on_new_mention():
     routing3, session3, _ = store.route_stimulus(third)
     assert routing3 == "ambient"
     assert session3 is None
+
+
+def test_expire_due_skips_scan_until_a_session_can_lapse():
+    store = SessionStore(ttl_seconds=30.0)
+    assert store.expire_due() == []
+
+    stim = Stimulus(
+        type="discord_message",
+        source="discord",
+        context={"author_id": 5, "server_id": "guild", "channel_id": 99, "mentions_bot": True},
+        salience=0.6,
+    )
+    _, session, _ = store.route_stimulus(stim)
+    assert store.next_expiry_at == session.expires_at
+    assert store.expire_due(session.expires_at - 1) == []
+
+    session.expires_at = time.time() - 1
+    ended = store.expire_due(store.next_expiry_at)
+    assert ended and ended[0][0].user_id == 5
+    assert store.next_expiry_at == float("inf")
+
+
+def test_expire_due_ignores_entries_superseded_by_an_extension():
+    store = SessionStore(ttl_seconds=30.0)
+    context = {"author_id": 6, "server_id": "guild", "channel_id": 99, "mentions_bot": True}
+    _, session, _ = store.route_stimulus(Stimulus(type="discord_message", source="discord", context=dict(context)))
+    first_expiry = session.expires_at
+    time.sleep(0.01)
+    _, again, _ = store.route_stimulus(Stimulus(type="discord_message", source="discord", context=dict(context)))
+    assert again is session and session.expires_at > first_expiry
+
+    assert store.expire_due(first_expiry) == []
+    assert store.next_expiry_at == session.expires_at
+    ended = store.expire_due(session.expires_at)
+    assert [s.user_id for s, reason in ended] == [6]
+    assert store.get(6, "guild", 99) is None
@@ -65,3 +65,27 @@ def test_social_reality_explains_no_raw_logs(tmp_path):
     assert out.recommended_action.type == "reply"
     assert "raw chat logs" in out.recommended_action.payload["content"].lower()
 
+
+
+def test_capture_important_memory_only_saves_on_trigger_phrases():
+    from types import SimpleNamespace
+
+    from vyxen_core.cognition import CognitionLoop
+
+    saved = []
+    memory = SimpleNamespace(save_important=lambda *args, **kwargs: saved.append(args[2:4]))
+    loop = SimpleNamespace(memory=memory)
+
+    CognitionLoop._capture_important_memory(loop, "guild", "123", "what's the server rules channel?")
+    assert saved == []
+
+    CognitionLoop._capture_important_memory(loop, "guild", "123", "you can call me Vee.")
+    CognitionLoop._capture_important_memory(loop, "guild", "123", "please keep it short")
+    CognitionLoop._capture_important_memory(loop, "guild", "123", "My name is Dana")
+    CognitionLoop._capture_important_memory(loop, "guild", "123", "I don't like spam")
+    assert saved == [
+        ("preferred_name", "Vee"),
+        ("communication", "prefers concise"),
+        ("preferred_name", "Dana"),
+        ("dislikes", "spam"),
+    ]
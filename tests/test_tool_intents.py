@@ -497,3 +497,45 @@ def test_parse_setup_wizard_start_and_progress():
     assert parsed2 is not None
     assert parsed2.intent_type == "setup_wizard_progress"
     assert parsed2.requested_changes["answer"] == "car community"
+
+
+def test_parse_intent_cache_returns_independent_copies():
+    parse_natural_language_intent.cache_clear()
+    context = {"content": "create role 'Cached'", "channel_id": 7, "server_id": "guild"}
+    first = parse_natural_language_intent(Stimulus(type="discord_message", source="test", context=dict(context)))
+    first.requested_changes["role_name"] = "mutated"
+    second = parse_natural_language_intent(Stimulus(type="discord_message", source="test", context=dict(context)))
+    assert second is not None
+    assert second.intent_type == "create_role"
+    assert second.requested_changes["role_name"].lower() == "cached"
+
+
+def test_parse_intent_cache_keys_on_mentions():
+    parse_natural_language_intent.cache_clear()
+    base = {"content": "give the Mods role to user", "channel_id": 7, "server_id": "guild"}
+    without = parse_natural_language_intent(Stimulus(type="discord_message", source="test", context=dict(base)))
+    with_mention = parse_natural_language_intent(
+        Stimulus(type="discord_message", source="test", context={**base, "mentioned_user_ids": [123456789012345678]})
+    )
+    assert without is None or without.intent_type != "assign_role"
+    assert with_mention is not None
+    assert with_mention.intent_type == "assign_role"
+    assert with_mention.requested_changes["member_id"] == "123456789012345678"
+
+
+def test_parse_plain_chat_without_trigger_words_is_not_an_intent():
+    stim = Stimulus(
+        type="discord_message",
+        source="test",
+        context={"content": "haha that is so good, see you tomorrow", "channel_id": 1, "server_id": "guild"},
+    )
+    assert parse_natural_language_intent(stim) is None
+
+
+def test_parse_keeps_name_casing_for_ascii_and_unicode_messages():
+    for content, expected in (("CREATE ROLE CALLED DvsTeam", "DvsTeam"), ("Create role called DvsTeam ✨", "DvsTeam")):
+        stim = Stimulus(type="discord_message", source="test", context={"content": content, "channel_id": 1})
+        parsed = parse_natural_language_intent(stim)
+        assert parsed is not None
+        assert parsed.intent_type == "create_role"
+        assert parsed.requested_changes["role_name"] == expected
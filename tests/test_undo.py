@@ -1,9 +1,12 @@
 import asyncio
 import types
+from types import MappingProxyType
 
 from discord_adapter import DiscordAdapter
 from vyxen_core.action_journal import ActionEntry
 
+_EMPTY = MappingProxyType({})
+
 
 class DummyRole:
     def __init__(self, role_id: int, name: str = "r", perms: int = 0):
@@ -34,15 +37,19 @@ class DummyChannel:
         self.moved_to = category.id if category else None
 
     def overwrites_for(self, role):
-        return DummyOverwrite(self._overwrites.get(role.id, {}))
+        return DummyOverwrite(self._overwrites.get(role.id, _EMPTY))
 
     async def set_permissions(self, role, overwrite=None, reason: str = ""):
-        self._overwrites[role.id] = dict(overwrite.data)
+        # Share the mapping; the overwrite copies again before any later write.
+        self._overwrites[role.id] = overwrite.data
+        overwrite._owned = False
 
 
 class DummyOverwrite:
     def __init__(self, data):
-        self.data = data.copy()
+        # Copy-on-write: read through the channel's mapping until the first assignment.
+        self.data = data
+        self._owned = False
 
     def __iter__(self):
         for k, v in self.data.items():
@@ -52,22 +59,25 @@ class DummyOverwrite:
         return self.data.get(item)
 
     def __setattr__(self, key, value):
-        if key == "data":
+        if key in ("data", "_owned"):
             super().__setattr__(key, value)
         else:
+            if not self._owned:
+                self.data = dict(self.data)
+                self._owned = True
             self.data[key] = value
 
 
 class DummyGuild:
     def __init__(self):
-        self.roles = {}
-        self.channels = {}
+        self.roles: dict[int, DummyRole] = {}
+        self.channels: dict[int, DummyChannel] = {}
 
     def get_role(self, rid):
-        return self.roles.get(int(rid))
+        return self.roles.get(rid if type(rid) is int else int(rid))
 
     def get_channel(self, cid):
-        return self.channels.get(int(cid))
+        return self.channels.get(cid if type(cid) is int else int(cid))
 
 
 def test_undo_create_role_deletes_role():
@@ -6,16 +6,26 @@ tracking, and governor logic that operate independently from any specific I/O
 adapter. Discord integration lives in the adapter layer.
 """
 
-from .config import RuntimeConfig
-from .stimuli import Stimulus
-from .state import InternalState
-from .identity import IdentityCore
-from .memory import CausalMemory
-from .actions import ActionIntent, ActionResult
-from .conversation import ConversationSession, SessionStore
-from .governor import Governor
-from .cognition import CognitionLoop
-from .tool_intents import ParsedIntent, parse_natural_language_intent
+import importlib
+from typing import Any
+
+# Exports resolve on first access (PEP 562), so importing one submodule does not drag in
+# the cognition loop and the rest of the runtime.
+_LAZY = {
+    "RuntimeConfig": ".config",
+    "Stimulus": ".stimuli",
+    "InternalState": ".state",
+    "IdentityCore": ".identity",
+    "CausalMemory": ".memory",
+    "ActionIntent": ".actions",
+    "ActionResult": ".actions",
+    "ConversationSession": ".conversation",
+    "SessionStore": ".conversation",
+    "Governor": ".governor",
+    "CognitionLoop": ".cognition",
+    "ParsedIntent": ".tool_intents",
+    "parse_natural_language_intent": ".tool_intents",
+}
 
 __all__ = [
     "RuntimeConfig",
@@ -32,3 +42,16 @@ __all__ = [
     "Governor",
     "CognitionLoop",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,32 +1,70 @@
+import sys
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Deque, Dict, Mapping, Optional, Union
 
 
-@dataclass
+# Entries carry monotonic_ns stamps (cheap int, immune to clock steps); this converts them
+# back to wall-clock seconds for display.
+_EPOCH_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+
+def wall_time(entry: "ActionEntry") -> float:
+    return (entry.timestamp + _EPOCH_OFFSET_NS) / 1e9
+
+
+def _user_key(user_id: Union[int, str]) -> int:
+    """
+    Normalise a Discord user id to an int key; non-numeric ids (tests, system actors) hash instead.
+    """
+    try:
+        return int(user_id)
+    except (TypeError, ValueError):
+        return hash(user_id)
+
+
+_EMPTY_STATE: Mapping[str, Any] = MappingProxyType({})
+
+
+def _freeze_state(state: Dict[str, Any] | None) -> Mapping[str, Any] | None:
+    """
+    Snapshot a before/after state as a read-only view so later edits by the caller cannot leak in.
+    """
+    if state is None:
+        return None
+    if not state:
+        return _EMPTY_STATE
+    return MappingProxyType(dict(state))
+
+
+@dataclass(slots=True, frozen=True)
 class ActionEntry:
-    user_id: str
+    user_id: int
     action_type: str
     targets: Dict[str, Any]
-    before_state: Dict[str, Any] | None
-    after_state: Dict[str, Any] | None
+    before_state: Mapping[str, Any] | None
+    after_state: Mapping[str, Any] | None
     reversible: bool
-    timestamp: float = field(default_factory=time.time)
+    timestamp: int = field(default_factory=time.monotonic_ns)
 
 
 class ActionJournal:
     """
     In-memory journal of admin actions to support explain/undo.
-    Keeps a bounded list per user.
+    Keeps a bounded deque per user; the oldest entries fall off automatically.
     """
 
     def __init__(self, max_entries_per_user: int = 25):
         self.max_entries_per_user = max_entries_per_user
-        self._entries: Dict[str, List[ActionEntry]] = {}
+        self._entries: Dict[int, Deque[ActionEntry]] = {}
+        # Reversible entries only, oldest first, mirroring their order in _entries.
+        self._reversible: Dict[int, Deque[ActionEntry]] = {}
 
     def record(
         self,
-        user_id: str,
+        user_id: Union[int, str],
         action_type: str,
         targets: Dict[str, Any],
         before_state: Dict[str, Any] | None,
@@ -34,33 +72,46 @@ class ActionJournal:
         reversible: bool,
     ) -> ActionEntry:
         entry = ActionEntry(
-            user_id=str(user_id),
-            action_type=action_type,
+            user_id=_user_key(user_id),
+            # Identifier-like literals are interned already; this covers composed names too.
+            action_type=sys.intern(action_type),
             targets=targets,
-            before_state=before_state,
-            after_state=after_state,
+            before_state=_freeze_state(before_state),
+            after_state=_freeze_state(after_state),
             reversible=reversible,
         )
-        bucket = self._entries.setdefault(str(user_id), [])
+        uid = entry.user_id
+        bucket = self._entries.get(uid)
+        if bucket is None:
+            bucket = self._entries[uid] = deque(maxlen=self.max_entries_per_user)
+            self._reversible[uid] = deque()
+        reversible_bucket = self._reversible[uid]
+        if len(bucket) == bucket.maxlen and bucket and bucket[0].reversible:
+            # The entry about to be evicted is the oldest reversible one.
+            reversible_bucket.popleft()
         bucket.append(entry)
-        if len(bucket) > self.max_entries_per_user:
-            bucket.pop(0)
+        if reversible and bucket.maxlen != 0:
+            reversible_bucket.append(entry)
         return entry
 
-    def last(self, user_id: str) -> Optional[ActionEntry]:
-        bucket = self._entries.get(str(user_id)) or []
+    def last(self, user_id: Union[int, str]) -> Optional[ActionEntry]:
+        bucket = self._entries.get(_user_key(user_id)) or ()
         return bucket[-1] if bucket else None
 
-    def last_reversible(self, user_id: str) -> Optional[ActionEntry]:
-        bucket = self._entries.get(str(user_id)) or []
-        for entry in reversed(bucket):
-            if entry.reversible:
-                return entry
-        return None
+    def last_reversible(self, user_id: Union[int, str]) -> Optional[ActionEntry]:
+        reversible_bucket = self._reversible.get(_user_key(user_id))
+        return reversible_bucket[-1] if reversible_bucket else None
 
-    def pop_last_reversible(self, user_id: str) -> Optional[ActionEntry]:
-        bucket = self._entries.get(str(user_id)) or []
+    def pop_last_reversible(self, user_id: Union[int, str]) -> Optional[ActionEntry]:
+        uid = _user_key(user_id)
+        reversible_bucket = self._reversible.get(uid)
+        if not reversible_bucket:
+            return None
+        entry = reversible_bucket.pop()
+        bucket = self._entries[uid]
         for idx in range(len(bucket) - 1, -1, -1):
-            if bucket[idx].reversible:
-                return bucket.pop(idx)
-        return None
+            if bucket[idx] is entry:
+                # Usually at or near the tail, so the deque delete stays cheap.
+                del bucket[idx]
+                break
+        return entry
@@ -1,43 +1,49 @@
 import asyncio
 import time
-from collections import deque
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import Any, Dict, Optional
 
 from .config import RuntimeConfig
 
 
-ACTION_TYPES = {"send_message", "reply", "react", "defer", "schedule", "observe", "tool_call"}
+ACTION_TYPES = frozenset({"send_message", "reply", "react", "defer", "schedule", "observe", "tool_call"})
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionIntent:
     type: str
     target_id: Optional[int]
     payload: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
-    created_at: float = field(default_factory=lambda: time.time())
+    created_at: float = field(default_factory=time.time)
+    # Decision trail for the audit log; kept out of metadata so to_dict never has to filter it.
+    audit_context: Optional[Dict[str, Any]] = None
 
     def __post_init__(self) -> None:
         if self.type not in ACTION_TYPES:
             raise ValueError(f"Unsupported action type: {self.type}")
 
     def to_dict(self, include_metadata: bool = True) -> Dict[str, Any]:
+        metadata = self.metadata
+        if include_metadata and self.audit_context is not None:
+            metadata = {**metadata, "audit_context": self.audit_context}
         return {
             "type": self.type,
             "target_id": self.target_id,
             "payload": self.payload,
-            "metadata": self.metadata if include_metadata else {k: v for k, v in self.metadata.items() if k != "audit_context"},
+            "metadata": metadata,
             "created_at": self.created_at,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionResult:
     intent: ActionIntent
     success: bool
     detail: str = ""
-    executed_at: float = field(default_factory=lambda: time.time())
+    executed_at: float = field(default_factory=time.time)
 
     def to_dict(self, include_metadata: bool = True) -> Dict[str, Any]:
         return {
@@ -49,32 +55,74 @@ class ActionResult:
 
 
 class RateLimiter:
-    def __init__(self, config: RuntimeConfig):
+    """
+    Sliding-window limiter keyed by action/target. Stamps use time.monotonic() so wall-clock
+    adjustments cannot open or close the window; the least recently used keys are dropped
+    once max_keys is exceeded.
+    """
+
+    def __init__(self, config: RuntimeConfig, max_keys: int = 4096):
         self.config = config
         self.window = 60.0
-        self.actions: Dict[str, list[float]] = {}
-
-    def allow(self, key: str) -> bool:
-        now = time.time()
-        if key not in self.actions:
-            self.actions[key] = []
-        self.actions[key] = [t for t in self.actions[key] if now - t < self.window]
-        if len(self.actions[key]) >= self.config.max_actions_per_minute:
+        self.max_keys = max_keys
+        self.actions: "OrderedDict[str, deque[float]]" = OrderedDict()
+        self._last_sweep = time.monotonic()
+
+    def _sweep(self, now: float) -> None:
+        # Drop keys with nothing left in the window so idle targets do not hold entries.
+        cutoff = now - self.window
+        stale = [key for key, stamps in self.actions.items() if not stamps or stamps[-1] <= cutoff]
+        for key in stale:
+            del self.actions[key]
+        self._last_sweep = now
+
+    def allow(self, key: str, now: Optional[float] = None) -> bool:
+        # Callers checking several keys in one cycle can pass a single monotonic reading.
+        if now is None:
+            now = time.monotonic()
+        if now - self._last_sweep > self.window:
+            self._sweep(now)
+        stamps = self.actions.get(key)
+        if stamps is None:
+            stamps = self.actions[key] = deque()
+            if len(self.actions) > self.max_keys:
+                self.actions.popitem(last=False)
+        else:
+            self.actions.move_to_end(key)
+            if not isinstance(stamps, deque):
+                # Accept plain lists assigned from outside (tests seed history this way).
+                stamps = self.actions[key] = deque(stamps)
+        # Timestamps are appended in order, so expired entries are always at the head.
+        cutoff = now - self.window
+        while stamps and stamps[0] <= cutoff:
+            stamps.popleft()
+        if len(stamps) >= self.config.max_actions_per_minute:
             return False
         # Basic burst control
-        recent_burst = [t for t in self.actions[key] if now - t < 5]
-        if len(recent_burst) >= self.config.action_burst:
+        burst_cutoff = now - 5
+        recent_burst = 0
+        for t in reversed(stamps):
+            if t <= burst_cutoff:
+                break
+            recent_burst += 1
+        if recent_burst >= self.config.action_burst:
             return False
-        self.actions[key].append(now)
+        stamps.append(now)
         return True
 
 
 class ActionAuditor:
-    def __init__(self, max_records: int = 2000):
+    def __init__(self, max_records: int = 2000, max_failures: int = 256):
         self.records: deque[ActionResult] = deque(maxlen=max_records)
+        # Failures are indexed separately so recent_failures never scans the full history.
+        self.failures: deque[ActionResult] = deque(maxlen=max_failures)
 
     def record(self, result: ActionResult) -> None:
         self.records.append(result)
+        if not result.success:
+            self.failures.append(result)
 
     def recent_failures(self, limit: int = 5) -> list[ActionResult]:
-        return [r for r in self.records if not r.success][-limit:]
+        if limit <= 0:
+            return []
+        return list(islice(reversed(self.failures), limit))[::-1]
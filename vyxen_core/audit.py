@@ -1,10 +1,40 @@
+import atexit
 import json
 import logging
+import logging.handlers
+import queue
+import threading
+import time
 from pathlib import Path
 from typing import Any, Dict, List
 
 from .config import RuntimeConfig
 
+try:
+    import orjson
+except ImportError:  # optional speedup; json is the fallback
+    orjson = None
+
+_AUDIT_BUFFER_RECORDS = 256
+_AUDIT_FLUSH_SECONDS = 5.0
+_AUDIT_QUEUE_MAX = 20000
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Never blocks the caller: when the listener falls behind, records are counted and dropped.
+    """
+
+    def __init__(self, records: "queue.Queue[logging.LogRecord]"):
+        super().__init__(records)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
 
 def build_logger(config: RuntimeConfig) -> logging.Logger:
     config.ensure_paths()
@@ -12,15 +42,74 @@ def build_logger(config: RuntimeConfig) -> logging.Logger:
     if logger.handlers:
         return logger
     logger.setLevel(logging.INFO)
-    handler = logging.FileHandler(config.audit_log_path, encoding="utf-8")
+    # Rotate instead of growing forever; delay defers opening the file until the first write.
+    handler = logging.handlers.RotatingFileHandler(
+        config.audit_log_path,
+        maxBytes=config.audit_log_max_bytes,
+        backupCount=config.audit_log_backups,
+        encoding="utf-8",
+        delay=True,
+    )
     formatter = logging.Formatter(
         "%(asctime)s [%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
     )
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    # Callers only enqueue; a listener thread formats and writes in batches, so the event
+    # loop never waits on disk. Warnings and errors flush the batch immediately.
+    buffered = logging.handlers.MemoryHandler(
+        _AUDIT_BUFFER_RECORDS, flushLevel=logging.WARNING, target=handler
+    )
+    records: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=_AUDIT_QUEUE_MAX)
+    listener = logging.handlers.QueueListener(records, buffered)
+    listener.start()
+    _start_flusher(buffered)
+    atexit.register(_shutdown, listener, buffered)
+    logger.addHandler(_DroppingQueueHandler(records))
     return logger
 
 
+def audit_dropped(logger: logging.Logger | None = None) -> int:
+    """
+    Records discarded because the audit queue was full.
+    """
+    logger = logger or logging.getLogger("vyxen.audit")
+    return sum(getattr(h, "dropped", 0) for h in logger.handlers)
+
+
+def _start_flusher(buffered: logging.handlers.MemoryHandler) -> None:
+    """
+    Push out partial batches on an interval so a quiet bot still lands records promptly.
+    """
+
+    def _run() -> None:
+        while True:
+            time.sleep(_AUDIT_FLUSH_SECONDS)
+            try:
+                buffered.flush()
+            except Exception:
+                pass
+
+    threading.Thread(target=_run, name="vyxen-audit-flush", daemon=True).start()
+
+
+def _shutdown(listener: logging.handlers.QueueListener, buffered: logging.handlers.MemoryHandler) -> None:
+    try:
+        listener.stop()
+        buffered.close()
+    except Exception:
+        pass
+
+
+def _dumps(payload: Dict[str, Any]) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # Values orjson refuses (e.g. ints past 64 bits) still go through json.
+            pass
+    return json.dumps(payload)
+
+
 def log_decision(
     logger: logging.Logger,
     stimulus: Dict[str, Any],
@@ -34,4 +123,4 @@ def log_decision(
         "governor": governor_choice,
         "action_result": action_result,
     }
-    logger.info(json.dumps(payload))
+    logger.info(_dumps(payload))
@@ -1,6 +1,7 @@
 import asyncio
 import concurrent.futures
 import os
+import re
 import time
 from typing import List, Optional, Dict, Any
 try:
@@ -29,6 +30,48 @@ from .realities import (
 from .state import InternalState
 from .stimuli import Stimulus
 
+# Profiling markers for _reflect; each class is one alternation over the lowercased message.
+_HUMOR_RE = re.compile("lol|lmao|haha|😂")
+_WARMTH_RE = re.compile("thanks|appreciate|please")
+_FORMAL_RE = re.compile("please|thank you|regards")
+_PRECISION_RE = re.compile("[:-]")  # "->" is covered by "-"
+
+# Every trigger phrase _capture_important_memory reacts to; one scan rules out the common
+# message that mentions none of them.
+_IMPORTANT_HINT_RE = re.compile(
+    "call me|my name is|i prefer (?:being|to be) called|favorite car|pronouns|i like|i love"
+    "|i dislike|i don't like|i do not like|don't ping me|do not ping me|keep it short|short replies"
+)
+_NAME_RE = re.compile(r"\b(?:my name is|i prefer (?:being|to be) called|call me)\b(.*)", re.IGNORECASE | re.DOTALL)
+# Greedy prefix: like str.split(...)[-1], the text after the last occurrence wins.
+_LIKES_RE = re.compile(r".*\bi (?:like|love)\b(.*)", re.IGNORECASE | re.DOTALL)
+_DISLIKES_RE = re.compile(r".*\bi (?:dislike|don't like|do not like)\b(.*)", re.IGNORECASE | re.DOTALL)
+_FAVORITE_CAR_RE = re.compile(r"\b(?:my\s+)?favorite\s+car\s+is\s+(.+)$", re.IGNORECASE)
+
+_MEM_INFO_REFRESH_SECONDS = 5.0
+_WATCHDOG_PROBE_SECONDS = 5.0
+
+
+def _prune_echo_context(ctx: Dict[str, Any]) -> Dict[str, Any]:
+    # Avoid recursive growth/circular references in contexts. Echo contexts are freshly
+    # decoded from the memory DB, so one without nested echoes can be shared as is.
+    if "memory_echoes" not in ctx:
+        return ctx
+    return {k: v for k, v in ctx.items() if k != "memory_echoes"}
+
+
+def _interpret_batch(realities: List[Any], *args: Any) -> List[Any]:
+    """
+    Run several cheap realities back to back, returning each output or its exception.
+    """
+    results: List[Any] = []
+    for reality in realities:
+        try:
+            results.append(reality.interpret(*args))
+        except Exception as exc:
+            results.append(exc)
+    return results
+
 
 class CognitionLoop:
     def __init__(
@@ -77,6 +120,19 @@ class CognitionLoop:
         self.state.safe_mode = config.safe_mode_default
         self.health_task: Optional[asyncio.Task] = None
         self.maintenance_task: Optional[asyncio.Task] = None
+        self._trace = config.cognition_trace
+        llm.configure_reply_cache(config.llm_cache_ttl_s, config.llm_cache_size)
+        self._mem_info: Dict[str, Any] = {}
+        self._mem_info_at = float("-inf")
+        self._cpu_count = os.cpu_count() or 1
+        self._load_avg: Optional[float] = None
+        self._rss_mb: Optional[float] = None
+        self._probe_at = float("-inf")
+        # PM2 sets this when it spawns the process; it cannot change while we run.
+        try:
+            self._pm2_restart_count: Optional[int] = int(os.getenv("PM2_RESTART_TIME", "0") or 0)
+        except Exception:
+            self._pm2_restart_count = None
 
     async def start(self) -> None:
         self.running = True
@@ -84,6 +140,8 @@ class CognitionLoop:
             self.health_task = asyncio.create_task(self._health_monitor())
         if self.maintenance_task is None:
             self.maintenance_task = asyncio.create_task(self._maintenance_loop())
+        # Ticks are paced against an absolute target so sleep overshoot does not accumulate as drift.
+        next_tick_at = time.monotonic()
         try:
             while self.running:
                 tick_start = time.monotonic()
@@ -109,7 +167,13 @@ class CognitionLoop:
                     continue
                 elapsed = time.monotonic() - tick_start
                 self._watchdog(elapsed)
-                await asyncio.sleep(max(0.0, self._current_tick_interval() - elapsed))
+                next_tick_at += self._current_tick_interval()
+                delay = next_tick_at - time.monotonic()
+                if delay < 0:
+                    # Overran: start the next tick now rather than bursting to catch up.
+                    next_tick_at -= delay
+                    delay = 0.0
+                await asyncio.sleep(delay)
         finally:
             self.running = False
             if self.health_task:
@@ -134,7 +198,7 @@ class CognitionLoop:
         self._update_status_snapshot()
 
         # Expire sessions on each tick to allow reflection even without new stimuli
-        ended_sessions = self.sessions.expire_stale()
+        ended_sessions = self.sessions.expire_due()
         for session, reason in ended_sessions:
             self._reflect_session_end(session, reason)
 
@@ -143,6 +207,9 @@ class CognitionLoop:
             return
 
         stimuli = await self._perceive(self.config.max_stimuli_per_tick)
+        if len(stimuli) == 1 and stimuli[0].type == "silence":
+            await self._handle_silence(stimuli[0])
+            return
         for stim in stimuli:
             if time.monotonic() > deadline:
                 self._record_overrun("tick_budget_exceeded")
@@ -169,7 +236,7 @@ class CognitionLoop:
                 self._record_overrun("interpret_budget_exceeded")
                 return
             try:
-                decision = self._decide(stim, interpretations)
+                decision = self._decide(stim, interpretations, mention, session_active, directed)
             except Exception as exc:
                 self.logger.warning("Decision step failed for %s: %s", stim.type, exc)
                 continue
@@ -184,22 +251,46 @@ class CognitionLoop:
                 self.state.safe_mode = True
                 self.logger.warning("Reflection failed; forcing Safe Mode: %s", exc)
 
+    async def _handle_silence(self, stim: Stimulus) -> None:
+        """
+        Idle-tick path: silence is system-routed, so the governor never weighs reality
+        output for it and _reflect ignores it; skip interpretation and go straight to act.
+        """
+        server_id = stim.context.get("server_id")
+        if server_id is not None:
+            self.state.last_server_id = server_id
+        self.state.update_on_stimulus(stim.type, stim.salience)
+        try:
+            decision = self._decide(stim, [], False, False, False)
+        except Exception as exc:
+            self.logger.warning("Decision step failed for %s: %s", stim.type, exc)
+            return
+        try:
+            await self._act(decision)
+        except Exception as exc:
+            self.logger.warning("Action dispatch failed for %s: %s", stim.type, exc)
+
     async def _perceive(self, max_items: int) -> List[Stimulus]:
-        stimuli: List[Stimulus] = []
-        for _ in range(max_items):
-            try:
-                stimuli.append(self.stimulus_queue.get_nowait())
-            except asyncio.QueueEmpty:
-                break
+        drain = getattr(self.stimulus_queue, "drain", None)
+        if drain is not None:
+            stimuli: List[Stimulus] = drain(max_items)
+        else:
+            stimuli = []
+            for _ in range(max_items):
+                try:
+                    stimuli.append(self.stimulus_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
 
         if not stimuli and self.stimulus_queue.qsize() > 0:
             self._record_overrun("stimulus_queue_backlog")
 
         if stimuli and any(s.type != "silence" for s in stimuli):
-            try:
-                print(f"[COG] draining {len(stimuli)} stimuli (queue now {self.stimulus_queue.qsize()})")
-            except Exception:
-                pass
+            if self._trace:
+                try:
+                    print(f"[COG] draining {len(stimuli)} stimuli (queue now {self.stimulus_queue.qsize()})")
+                except Exception:
+                    pass
             if len(stimuli) > self.config.max_stimuli_per_tick:
                 stimuli = stimuli[: self.config.max_stimuli_per_tick]
 
@@ -243,7 +334,7 @@ class CognitionLoop:
                 stim.context["session_active"] = False
                 routed_stimuli.append(stim)
                 continue
-            if stim.type != "silence":
+            if self._trace and stim.type != "silence":
                 try:
                     print(
                         f"[ROUTE] type={stim.type} routing={stim.routing} mention={stim.context.get('mentions_bot')} session={stim.context.get('session_active')}"
@@ -256,13 +347,6 @@ class CognitionLoop:
                 stim.context["memory_echoes"] = []
             else:
                 echoes = self.memory.echoes(stim.context.get("server_id", "global"), stim)
-
-                def _prune_echo_context(ctx: dict) -> dict:
-                    # Avoid recursive growth/circular references in contexts
-                    trimmed = dict(ctx)
-                    trimmed.pop("memory_echoes", None)
-                    return trimmed
-
                 stim.context["memory_echoes"] = [_prune_echo_context(e.context) for e in echoes]
             routed_stimuli.append(stim)
         return routed_stimuli
@@ -273,72 +357,56 @@ class CognitionLoop:
             return []
 
         loop = asyncio.get_running_loop()
-        timeout = max(0.01, deadline - time.monotonic())
-        futures = [
-            loop.run_in_executor(
-                self._interpret_executor,
-                reality.interpret,
-                stimulus,
-                self.state,
-                self.memory,
-                self.identity,
-            )
-            for reality in realities
-        ]
-        done: set[asyncio.Future] = set()
-        pending: set[asyncio.Future] = set()
-        try:
-            done, pending = await asyncio.wait(futures, timeout=timeout)
-        except Exception as exc:
-            self.logger.warning("Reality interpretation scheduling error: %s", exc)
-            return []
-
-        outputs: List[RealityOutput] = []
-        for fut in done:
+        # Realities that wait on SQLite or the LLM get a worker each. The CPU-only ones take
+        # microseconds and would only serialise on the GIL in a thread, so they run inline
+        # while the blocking ones are in flight.
+        solo = [r for r in realities if getattr(r, "blocking_io", False)]
+        batched = [r for r in realities if not getattr(r, "blocking_io", False)]
+        args = (stimulus, self.state, self.memory, self.identity)
+        futures = [loop.run_in_executor(self._interpret_executor, r.interpret, *args) for r in solo]
+        by_reality: Dict[int, Any] = {id(r): res for r, res in zip(batched, _interpret_batch(batched, *args))}
+        timed_out = False
+        if futures:
             try:
-                outputs.append(fut.result())
+                results = await asyncio.wait_for(
+                    asyncio.gather(*futures, return_exceptions=True), max(0.01, deadline - time.monotonic())
+                )
+            except asyncio.TimeoutError:
+                # wait_for cancelled the stragglers; keep whatever finished in time.
+                timed_out = True
+                results = [
+                    (fut.exception() or fut.result()) if fut.done() and not fut.cancelled() else None
+                    for fut in futures
+                ]
             except Exception as exc:
-                self.logger.warning("Reality interpretation error: %s", exc)
+                self.logger.warning("Reality interpretation scheduling error: %s", exc)
+                return []
+            by_reality.update({id(r): res for r, res in zip(solo, results)})
 
-        if pending:
-            for fut in pending:
-                try:
-                    fut.cancel()
-                except Exception:
-                    pass
+        # Keep configured reality order; the governor breaks score ties by position.
+        outputs: List[RealityOutput] = []
+        for reality in realities:
+            result = by_reality.get(id(reality))
+            if result is None:
+                continue
+            if isinstance(result, BaseException):
+                self.logger.warning("Reality interpretation error: %s", result)
+            else:
+                outputs.append(result)
+
+        if timed_out:
             self._record_overrun("interpret_timeout")
         return outputs
 
     def _decide(
-        self, stimulus: Stimulus, interpretations: List[RealityOutput]
+        self,
+        stimulus: Stimulus,
+        interpretations: List[RealityOutput],
+        mention: bool,
+        session_active: bool,
+        directed: bool,
     ) -> "GovernorDecisionWrapper":
-        mention = bool(stimulus.context.get("mentions_bot"))
-        session_active = bool(stimulus.context.get("session_active"))
-        directed = stimulus.routing == "directed" or mention or session_active
-
-        audit_ctx: Dict[str, Any] = {}
-        try:
-            ctx_trimmed: Dict[str, Any] = {k: v for k, v in stimulus.context.items() if k not in {"memory_echoes"}}
-            content_full = ctx_trimmed.pop("content", None)
-            if isinstance(content_full, str) and content_full:
-                ctx_trimmed["content_len"] = len(content_full)
-                ctx_trimmed["content_snippet"] = content_full[:160] + ("…" if len(content_full) > 160 else "")
-            audit_ctx = {
-                "type": stimulus.type,
-                "source": stimulus.source,
-                "context": ctx_trimmed,
-                "salience": stimulus.salience,
-                "timestamp": stimulus.timestamp,
-            }
-        except Exception:
-            audit_ctx = {
-                "type": stimulus.type,
-                "source": stimulus.source,
-                "context": {},
-                "salience": stimulus.salience,
-                "timestamp": stimulus.timestamp,
-            }
-
+        # mention/session_active/directed come from _tick, which already derived them.
         decision = self.governor.deliberate(
             server_id=stimulus.context.get("server_id", "global"),
             realities=interpretations,
@@ -362,34 +430,43 @@ class CognitionLoop:
                 rationale=decision.rationale,
             )
         if self.state.safe_mode and wrapper.intent.type not in {"reply", "send_message", "observe"}:
-            safe_wrapper = GovernorDecisionWrapper(
+            wrapper = GovernorDecisionWrapper(
                 intent=ActionIntent(type="observe", target_id=None, payload={}, metadata={"reason": "safe_mode_block"}),
                 interpretations=interpretations,
                 confidence=0.3,
                 risk=0.05,
                 rationale="Safe Mode limits actions to read-only replies.",
             )
-            audit_context = {
-                "stimulus": {
-                    **audit_ctx,
-                },
-                "realities": [o.to_dict(include_metadata=False) for o in interpretations],
-                "governor_choice": {
-                    "decision": safe_wrapper.rationale,
-                    "confidence": safe_wrapper.confidence,
-                    "risk": safe_wrapper.risk,
-                    "session_active": session_active,
-                    "mentioned": mention,
-                    "routing": stimulus.routing,
-                },
-            }
-            if stimulus.type != "silence":
-                safe_wrapper.intent.metadata["audit_context"] = audit_context
-            return safe_wrapper
+        # Silence ticks are never audited, so skip serialising the realities for them.
+        if stimulus.type != "silence":
+            wrapper.intent.audit_context = self._build_audit_context(
+                stimulus, interpretations, wrapper, mention, session_active
+            )
+        return wrapper
 
-        audit_context = {
+    def _build_audit_context(
+        self,
+        stimulus: Stimulus,
+        interpretations: List[RealityOutput],
+        wrapper: "GovernorDecisionWrapper",
+        mention: bool,
+        session_active: bool,
+    ) -> Dict[str, Any]:
+        try:
+            ctx_trimmed: Dict[str, Any] = {k: v for k, v in stimulus.context.items() if k not in {"memory_echoes"}}
+            content_full = ctx_trimmed.pop("content", None)
+            if isinstance(content_full, str) and content_full:
+                ctx_trimmed["content_len"] = len(content_full)
+                ctx_trimmed["content_snippet"] = content_full[:160] + ("…" if len(content_full) > 160 else "")
+        except Exception:
+            ctx_trimmed = {}
+        return {
             "stimulus": {
-                **audit_ctx,
+                "type": stimulus.type,
+                "source": stimulus.source,
+                "context": ctx_trimmed,
+                "salience": stimulus.salience,
+                "timestamp": stimulus.timestamp,
             },
             "realities": [o.to_dict(include_metadata=False) for o in interpretations],
             "governor_choice": {
@@ -401,9 +478,6 @@ class CognitionLoop:
                 "routing": stimulus.routing,
             },
         }
-        if stimulus.type != "silence":
-            wrapper.intent.metadata["audit_context"] = audit_context
-        return wrapper
 
     async def _act(self, decision: "GovernorDecisionWrapper") -> ActionResult:
         if self.state.safe_mode and decision.intent.type not in {"observe", "reply", "send_message"}:
@@ -426,7 +500,7 @@ class CognitionLoop:
                 )
             self.auditor.record(result)
             return result
-        if decision.intent.type != "observe":
+        if self._trace and decision.intent.type != "observe":
             try:
                 print(
                     f"[DECIDE] action={decision.intent.type} target={decision.intent.target_id} safe={self.state.safe_mode}"
@@ -476,25 +550,31 @@ class CognitionLoop:
     def _watchdog(self, tick_elapsed: float) -> None:
         overload = False
         reasons: list[str] = []
-        try:
-            load_avg = os.getloadavg()[0]
-            cpu_count = os.cpu_count() or 1
-            load_per_cpu = load_avg / max(1, cpu_count)
+        # Load average and peak RSS barely move between ticks; re-read them on an interval.
+        now = time.monotonic()
+        if now - self._probe_at >= _WATCHDOG_PROBE_SECONDS:
+            self._probe_at = now
+            try:
+                self._load_avg = os.getloadavg()[0]
+            except Exception:
+                self._load_avg = None
+            if resource:
+                try:
+                    self._rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+                except Exception:
+                    self._rss_mb = None
+
+        load_avg = self._load_avg
+        if load_avg is not None:
+            load_per_cpu = load_avg / self._cpu_count
             if load_per_cpu > self.config.watchdog_cpu_load:
                 overload = True
                 reasons.append(f"cpu_load={load_avg:.2f}/cpu={load_per_cpu:.2f}")
-        except Exception:
-            pass
 
-        if resource:
-            try:
-                usage = resource.getrusage(resource.RUSAGE_SELF)
-                mem_mb = usage.ru_maxrss / 1024
-                if mem_mb > self.config.watchdog_memory_mb:
-                    overload = True
-                    reasons.append(f"rss_mb={mem_mb:.0f}")
-            except Exception:
-                pass
+        mem_mb = self._rss_mb
+        if mem_mb is not None and mem_mb > self.config.watchdog_memory_mb:
+            overload = True
+            reasons.append(f"rss_mb={mem_mb:.0f}")
 
         expected = self._current_tick_interval()
         loop_lag = max(0.0, tick_elapsed - expected)
@@ -502,9 +582,10 @@ class CognitionLoop:
             overload = True
             reasons.append(f"loop_lag={loop_lag:.3f}")
 
-        if self.stimulus_queue.qsize() > self.config.watchdog_queue_depth:
+        backlog = self.stimulus_queue.qsize()
+        if backlog > self.config.watchdog_queue_depth:
             overload = True
-            reasons.append(f"stimuli_backlog={self.stimulus_queue.qsize()}")
+            reasons.append(f"stimuli_backlog={backlog}")
 
         if overload:
             self.state.safe_mode = True
@@ -519,7 +600,8 @@ class CognitionLoop:
             self.logger.warning("Watchdog throttle engaged: %s", note)
 
     def _update_status_snapshot(self) -> None:
-        uptime = time.monotonic() - self.state.start_time
+        now = time.monotonic()
+        uptime = now - self.state.start_time
         pm2_reason = self.pm2_breaker.reason if self.pm2_breaker.tripped else ""
         mem_tripped, mem_reason = (False, "")
         if hasattr(self.memory, "breaker_status"):
@@ -532,15 +614,22 @@ class CognitionLoop:
             llm_tripped, llm_reason = llm.breaker_status()
         except Exception:
             llm_tripped, llm_reason = False, ""
-        mem_info = {}
         try:
-            mem_info = self.memory.size_info()
-            self.state.memory_last_rotation = mem_info.get("last_rotation_ts")
-            self.state.memory_hot_mb = mem_info.get("hot_mb", 0.0)
-            self.state.memory_warm_mb = mem_info.get("warm_mb", 0.0)
-            self.state.memory_disabled_reason = mem_info.get("disabled_reason", "")
+            self.safety.llm_cache_hits, self.safety.llm_cache_misses = llm.cache_stats()
         except Exception:
             pass
+        # size_info stats two files; sizes move slowly, so refresh on an interval, not every tick.
+        if now - self._mem_info_at >= _MEM_INFO_REFRESH_SECONDS:
+            self._mem_info_at = now
+            try:
+                self._mem_info = self.memory.size_info()
+                self.state.memory_last_rotation = self._mem_info.get("last_rotation_ts")
+                self.state.memory_hot_mb = self._mem_info.get("hot_mb", 0.0)
+                self.state.memory_warm_mb = self._mem_info.get("warm_mb", 0.0)
+                self.state.memory_disabled_reason = self._mem_info.get("disabled_reason", "")
+            except Exception:
+                pass
+        mem_info = self._mem_info
         snapshot: Dict[str, Any] = {
             "safe_mode": self.state.safe_mode,
             "tick_interval": self._current_tick_interval(),
@@ -555,15 +644,14 @@ class CognitionLoop:
             "automod_enforcing": False,
             "automod_dry_run": True,
             "max_llm_calls": self.config.max_llm_calls_per_tick,
+            "llm_cache_hits": self.safety.llm_cache_hits,
+            "llm_cache_misses": self.safety.llm_cache_misses,
             "memory_hot_mb": mem_info.get("hot_mb", 0.0),
             "memory_warm_mb": mem_info.get("warm_mb", 0.0),
             "memory_last_rotation": mem_info.get("last_rotation_ts"),
             "memory_disabled_reason": mem_info.get("disabled_reason", ""),
         }
-        try:
-            snapshot["pm2_restart_count"] = int(os.getenv("PM2_RESTART_TIME", "0") or 0)
-        except Exception:
-            snapshot["pm2_restart_count"] = None
+        snapshot["pm2_restart_count"] = self._pm2_restart_count
         self.state.status_snapshot = snapshot
 
     async def _health_monitor(self) -> None:
@@ -674,16 +762,16 @@ class CognitionLoop:
             participants = [str(author_id), *mentioned_ids]
 
             # Lightweight profiling heuristics
-            verbosity_delta = clamp01(len(content) / 400) * 0.1 - 0.02
-            humor_delta = 0.05 if any(
-                marker in content.lower() for marker in ["lol", "lmao", "haha", "😂"]
-            ) else -0.01
+            content_lower = content.lower()
+            content_len = len(content)
+            verbosity_delta = clamp01(content_len / 400) * 0.1 - 0.02
+            humor_delta = 0.05 if _HUMOR_RE.search(content_lower) else -0.01
             tone_delta = 0.03 if "?" in content else -0.01
             success_delta = outcome_score * 0.05
-            warmth_delta = 0.04 if any(word in content.lower() for word in ["thanks", "appreciate", "please"]) else -0.01
-            formality_delta = 0.03 if any(word in content.lower() for word in ["please", "thank you", "regards"]) else -0.01
-            precision_delta = 0.04 if any(token in content for token in [":", "-", "->"]) else -0.005
-            brevity_delta = -0.03 if len(content) > 180 else 0.02
+            warmth_delta = 0.04 if _WARMTH_RE.search(content_lower) else -0.01
+            formality_delta = 0.03 if _FORMAL_RE.search(content_lower) else -0.01
+            precision_delta = 0.04 if _PRECISION_RE.search(content) else -0.005
+            brevity_delta = -0.03 if content_len > 180 else 0.02
 
             self.memory.record_shared_context(
                 server_id=server_id,
@@ -723,7 +811,9 @@ class CognitionLoop:
                 deltas={"trust": 0.03 * outcome_score, "affinity": 0.02},
             )
 
-            self._capture_important_memory(server_id, str(author_id), content)
+            # Up to six independent REPLACEs into user_important; commit them as one transaction.
+            with self.memory.write_batch():
+                self._capture_important_memory(server_id, str(author_id), content)
 
         # Capture trimmed content to avoid raw logging and recursive growth.
         context_snippet: Dict[str, Any] = {}
@@ -802,27 +892,20 @@ class CognitionLoop:
 
     def _capture_important_memory(self, server_id: str, user_id: str, content: str) -> None:
         lowered = content.lower()
+        if _IMPORTANT_HINT_RE.search(lowered) is None:
+            return
         weight = 0.0
-        if any(phrase in lowered for phrase in ["call me", "my name is", "you can call me", "i prefer being called", "i prefer to be called"]):
-            name = ""
-            if "my name is" in lowered:
-                name = content.split("my name is", 1)[-1].strip()
-            elif "i prefer being called" in lowered:
-                name = content.split("i prefer being called", 1)[-1].strip()
-            elif "i prefer to be called" in lowered:
-                name = content.split("i prefer to be called", 1)[-1].strip()
-            else:
-                # Handles both "call me" and "you can call me"
-                name = content.split("call me", 1)[-1].strip()
+        name_match = _NAME_RE.search(content)
+        if name_match:
+            # Covers "you can call me" too; matched on the original text so casing is kept.
+            name = name_match.group(1).strip()
             # Trim common punctuation tails.
             name = name.strip(" .,:;\"'“”")
             if name:
                 self.memory.save_important(server_id, user_id, "preferred_name", name[:64], weight=0.8)
                 weight += 0.2
         if "favorite car" in lowered:
-            import re
-
-            m = re.search(r"\b(?:my\s+)?favorite\s+car\s+is\s+(.+)$", content, flags=re.IGNORECASE)
+            m = _FAVORITE_CAR_RE.search(content)
             if m:
                 fav = (m.group(1) or "").strip(" .,:;\"'“”")
                 if fav:
@@ -833,21 +916,15 @@ class CognitionLoop:
             if pronouns:
                 self.memory.save_important(server_id, user_id, "pronouns", pronouns[:64], weight=0.8)
                 weight += 0.2
-        if "i like" in lowered or "i love" in lowered:
-            like_part = content.split("i like")[-1] if "i like" in lowered else content.split("i love")[-1]
-            like_part = like_part.strip(" .,:;")[:120]
+        likes_match = _LIKES_RE.match(content)
+        if likes_match:
+            like_part = likes_match.group(1).strip(" .,:;")[:120]
             if like_part:
                 self.memory.save_important(server_id, user_id, "likes", like_part, weight=0.6)
                 weight += 0.1
-        if "i dislike" in lowered or "i don't like" in lowered or "i do not like" in lowered:
-            dislike_part = (
-                content.split("i dislike")[-1]
-                if "i dislike" in lowered
-                else content.split("i don't like")[-1]
-                if "i don't like" in lowered
-                else content.split("i do not like")[-1]
-            )
-            dislike_part = dislike_part.strip(" .,:;")[:120]
+        dislikes_match = _DISLIKES_RE.match(content)
+        if dislikes_match:
+            dislike_part = dislikes_match.group(1).strip(" .,:;")[:120]
             if dislike_part:
                 self.memory.save_important(server_id, user_id, "dislikes", dislike_part, weight=0.6)
                 weight += 0.1
@@ -37,6 +37,9 @@ class RuntimeConfig:
     max_tasks_per_tick: int = 6
     max_stimuli_per_tick: int = 4
     max_llm_calls_per_tick: int = 1
+    # Reuse an LLM reply for a byte-identical prompt within this many seconds; <= 0 disables.
+    llm_cache_ttl_s: float = 120.0
+    llm_cache_size: int = 256
     stimulus_queue_limit: int = 200
     action_queue_limit: int = 50
     memory_path: Path = Path("vyxen_core/data/vyxen.db")
@@ -54,6 +57,8 @@ class RuntimeConfig:
     identity_learning_rate: float = 0.02
     session_ttl_seconds: float = 300.0
     audit_log_path: Path = Path("vyxen_core/data/audit.log")
+    audit_log_max_bytes: int = 128 * 1024 * 1024
+    audit_log_backups: int = 5
     max_actions_per_minute: int = 20
     action_burst: int = 5
     pm2_log_dir: Path = Path.home() / ".pm2" / "logs"
@@ -63,6 +68,8 @@ class RuntimeConfig:
     log_ingest_timeout_seconds: float = 0.25
     health_scan_interval: float = 120.0
     automod_dry_run: bool = True
+    # Per-stimulus [COG]/[ROUTE]/[DECIDE] trace lines on stdout.
+    cognition_trace: bool = False
     tools_enabled: bool = False
     tools_dry_run: bool = True
     admin_user_ids: tuple[str, ...] = ()
@@ -93,6 +100,8 @@ class RuntimeConfig:
             max_llm_calls_per_tick=_parse(
                 os.getenv("VYXEN_MAX_LLM_CALLS_PER_TICK"), int, default.max_llm_calls_per_tick
             ),
+            llm_cache_ttl_s=_parse(os.getenv("VYXEN_LLM_CACHE_TTL_S"), float, default.llm_cache_ttl_s),
+            llm_cache_size=_parse(os.getenv("VYXEN_LLM_CACHE_SIZE"), int, default.llm_cache_size),
             stimulus_queue_limit=_parse(os.getenv("VYXEN_STIMULUS_QUEUE_LIMIT"), int, default.stimulus_queue_limit),
             action_queue_limit=_parse(os.getenv("VYXEN_ACTION_QUEUE_LIMIT"), int, default.action_queue_limit),
             memory_path=Path(os.getenv("VYXEN_MEMORY_PATH", default.memory_path)),
@@ -118,6 +127,8 @@ class RuntimeConfig:
             identity_learning_rate=_parse(os.getenv("VYXEN_IDENTITY_LEARNING_RATE"), float, default.identity_learning_rate),
             session_ttl_seconds=_parse(os.getenv("VYXEN_SESSION_TTL_SECONDS"), float, default.session_ttl_seconds),
             audit_log_path=Path(os.getenv("VYXEN_AUDIT_LOG_PATH", default.audit_log_path)),
+            audit_log_max_bytes=_parse(os.getenv("VYXEN_AUDIT_LOG_MAX_BYTES"), int, default.audit_log_max_bytes),
+            audit_log_backups=_parse(os.getenv("VYXEN_AUDIT_LOG_BACKUPS"), int, default.audit_log_backups),
             max_actions_per_minute=_parse(os.getenv("VYXEN_MAX_ACTIONS_PER_MINUTE"), int, default.max_actions_per_minute),
             action_burst=_parse(os.getenv("VYXEN_ACTION_BURST"), int, default.action_burst),
             pm2_log_dir=Path(os.getenv("VYXEN_PM2_LOG_DIR", default.pm2_log_dir)),
@@ -131,6 +142,7 @@ class RuntimeConfig:
             ),
             health_scan_interval=_parse(os.getenv("VYXEN_HEALTH_SCAN_INTERVAL"), float, default.health_scan_interval),
             automod_dry_run=_parse_bool(os.getenv("VYXEN_AUTOMOD_DRY_RUN", ""), default.automod_dry_run),
+            cognition_trace=_parse_bool(os.getenv("VYXEN_COGNITION_TRACE", ""), default.cognition_trace),
             tools_enabled=_parse_bool(os.getenv("VYXEN_TOOLS_ENABLED", ""), default.tools_enabled),
             tools_dry_run=_parse_bool(os.getenv("VYXEN_TOOLS_DRY_RUN", ""), default.tools_dry_run),
             admin_user_ids=tuple(
@@ -1,3 +1,5 @@
+import heapq
+import itertools
 import time
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
@@ -27,6 +29,20 @@ class SessionStore:
         self.ttl_seconds = ttl_seconds
         self.sessions: Dict[Tuple[int, str, int], ConversationSession] = {}
         self.active_by_channel: Dict[Tuple[str, int], ConversationSession] = {}
+        # (expires_at, seq, key) per schedule or extension; entries for sessions that were
+        # extended or removed since are discarded when they surface. seq keeps keys uncompared.
+        self._expiry_heap: List[Tuple[float, int, Tuple[int, str, int]]] = []
+        self._expiry_seq = itertools.count()
+
+    @property
+    def next_expiry_at(self) -> float:
+        """
+        Lower bound on the earliest expires_at; no session can lapse before it.
+        """
+        return self._expiry_heap[0][0] if self._expiry_heap else float("inf")
+
+    def _schedule_expiry(self, key: Tuple[int, str, int], session: ConversationSession) -> None:
+        heapq.heappush(self._expiry_heap, (session.expires_at, next(self._expiry_seq), key))
 
     def _key(self, user_id: int, guild_id: str, channel_id: int) -> Tuple[int, str, int]:
         return (user_id, guild_id, channel_id)
@@ -45,6 +61,27 @@ class SessionStore:
             if session.expired(now):
                 ended.append((session, "timeout"))
                 self.sessions.pop(key, None)
+        # Full pass done; rebuild the heap from what is left so stale entries do not pile up.
+        seq = self._expiry_seq
+        self._expiry_heap = [(session.expires_at, next(seq), key) for key, session in self.sessions.items()]
+        heapq.heapify(self._expiry_heap)
+        return ended
+
+    def expire_due(self, now: Optional[float] = None) -> List[Tuple[ConversationSession, str]]:
+        """
+        Like expire_stale, but only visits heap entries that have come due instead of every session.
+        """
+        if now is None:
+            now = time.time()
+        heap = self._expiry_heap
+        sessions = self.sessions
+        ended: List[Tuple[ConversationSession, str]] = []
+        while heap and heap[0][0] <= now:
+            _, _, key = heapq.heappop(heap)
+            session = sessions.get(key)
+            if session is not None and session.expired(now):
+                ended.append((session, "timeout"))
+                del sessions[key]
         return ended
 
     def route_stimulus(
@@ -54,19 +91,21 @@ class SessionStore:
         Returns routing label, active session if any, and any sessions that expired
         as a result of this check.
         """
-        now = time.time()
-        ended = self.expire_stale()
-
+        # Stimuli that never touch a session route without an expiry pass; the cognition
+        # tick runs expire_due on its own, so nothing is left to lapse unreported.
         if stimulus.type not in {"discord_message", "attachment"}:
             stimulus.routing = "system"
-            return stimulus.routing, None, ended
+            return stimulus.routing, None, []
 
         author_id = stimulus.context.get("author_id")
         guild_id = stimulus.context.get("server_id") or "global"
         channel_id = stimulus.context.get("channel_id")
         if author_id is None or channel_id is None:
             stimulus.routing = "ambient"
-            return stimulus.routing, None, ended
+            return stimulus.routing, None, []
+
+        now = time.time()
+        ended = self.expire_due(now)
 
         mention = bool(stimulus.context.get("mentions_bot"))
         content = (stimulus.context.get("content") or "").strip().lower()
@@ -85,9 +124,8 @@ class SessionStore:
         def _looks_directed(text: str) -> bool:
             if not text:
                 return False
-            if text.startswith(("vyxen", "vyxen,", "vyxen:", "vox", "vox,")):
-                return True
-            if "vyxen" in text:
+            # "vyxen" anywhere covers every "vyxen..." prefix; "vox" only counts up front.
+            if "vyxen" in text or text.startswith("vox"):
                 return True
             if session and not session.expired(now) and session.user_id == author_id:
                 return True
@@ -105,6 +143,7 @@ class SessionStore:
                 session.last_interaction = now
                 session.expires_at = now + self.ttl_seconds
                 session.message_count += 1
+                self._schedule_expiry(key, session)
             else:
                 session = ConversationSession(
                     user_id=author_id,
@@ -116,6 +155,7 @@ class SessionStore:
                     message_count=1,
                 )
                 self.sessions[key] = session
+                self._schedule_expiry(key, session)
             self.active_by_channel[channel_key] = session
             stimulus.routing = "directed"
             return stimulus.routing, session, ended
@@ -124,6 +164,8 @@ class SessionStore:
             active_session.last_interaction = now
             active_session.expires_at = now + self.ttl_seconds
             active_session.message_count += 1
+            # Same user, guild and channel, so the author's key is the session's key.
+            self._schedule_expiry(key, active_session)
             stimulus.routing = "directed"
             return stimulus.routing, active_session, ended
 
@@ -180,32 +180,67 @@ def _singular_variants(tokens: Sequence[str]) -> Iterable[Tuple[str, ...]]:
     return ordered
 
 
-def _build_pattern_index(flags: Iterable[str]) -> dict[str, list[Tuple[Tuple[str, ...], str]]]:
-    patterns: list[Tuple[Tuple[str, ...], str]] = []
+def _iter_patterns(flags: Iterable[str]) -> Iterable[Tuple[Tuple[str, ...], str]]:
     for flag in set(flags):
         base_tokens = tuple(flag.split("_"))
         for variant in _singular_variants(base_tokens):
-            patterns.append((variant, flag))
+            yield variant, flag
 
     for flag, aliases in _EXTRA_ALIASES.items():
         for alias in aliases:
             alias_tokens = _tokenize(alias)
             if not alias_tokens:
                 continue
-            patterns.append((alias_tokens, flag))
+            yield alias_tokens, flag
 
-    # Prefer longest matches first
-    patterns.sort(key=lambda item: len(item[0]), reverse=True)
 
-    by_first: dict[str, list[Tuple[Tuple[str, ...], str]]] = {}
-    for tokens, flag in patterns:
-        first = tokens[0]
-        by_first.setdefault(first, []).append((tokens, flag))
-    return by_first
+# Tokens are [a-z0-9]+, so the empty string can never collide with a child key.
+_FLAG_KEY = ""
+
+
+def _build_pattern_trie(flags: Iterable[str]) -> dict:
+    """
+    Build a token trie of every flag phrasing; a node holding _FLAG_KEY ends a phrase.
+    Walking it from a token yields the longest matching phrase in one pass.
+    """
+    trie: dict = {}
+    for tokens, flag in _iter_patterns(flags):
+        node = trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node.setdefault(_FLAG_KEY, flag)
+    return trie
 
 
 _VALID_FLAGS = valid_permission_flags()
-_PATTERNS_BY_FIRST = _build_pattern_index(_VALID_FLAGS)
+_PATTERN_TRIE = _build_pattern_trie(_VALID_FLAGS)
+
+_SEPARATORS_RE = re.compile(r"[\s-]+")
+_UNDERSCORES_RE = re.compile(r"_+")
+_ASSIGN_RE = re.compile(
+    r"(?P<name>[a-zA-Z_][a-zA-Z0-9_ -]{1,60})\s*(?:=|:)\s*(?P<val>true|false|yes|no|on|off|allow|deny|enabled|disabled|unset|clear|reset)",
+    re.IGNORECASE,
+)
+
+
+def _longest_flag_match(tokens: Sequence[str], start: int) -> Tuple[Optional[str], int]:
+    """
+    Return (flag, token_count) for the longest phrase starting at tokens[start], or (None, 0).
+    """
+    flag: Optional[str] = None
+    length = 0
+    node = _PATTERN_TRIE.get(tokens[start])
+    index = start
+    end = len(tokens)
+    while node is not None:
+        index += 1
+        if _FLAG_KEY in node:
+            flag = node[_FLAG_KEY]
+            length = index - start
+        if index >= end:
+            break
+        node = node.get(tokens[index])
+    return flag, length
 
 
 def resolve_permission_flag(name: str) -> Optional[str]:
@@ -216,8 +251,8 @@ def resolve_permission_flag(name: str) -> Optional[str]:
     if not name:
         return None
 
-    normalized = re.sub(r"[\s-]+", "_", name.strip().lower())
-    normalized = re.sub(r"_+", "_", normalized).strip("_")
+    normalized = _SEPARATORS_RE.sub("_", name.strip().lower())
+    normalized = _UNDERSCORES_RE.sub("_", normalized).strip("_")
     if normalized in _VALID_FLAGS:
         return normalized
 
@@ -225,11 +260,8 @@ def resolve_permission_flag(name: str) -> Optional[str]:
     if not tokens:
         return None
 
-    candidates = _PATTERNS_BY_FIRST.get(tokens[0], [])
-    for pat_tokens, flag in candidates:
-        if len(tokens) == len(pat_tokens) and tuple(tokens) == tuple(pat_tokens):
-            return flag
-    return None
+    flag, length = _longest_flag_match(tokens, 0)
+    return flag if length == len(tokens) else None
 
 
 def parse_permission_overwrites(text: str) -> PermissionParseResult:
@@ -248,11 +280,7 @@ def parse_permission_overwrites(text: str) -> PermissionParseResult:
     unknown: list[str] = []
 
     # Explicit assignment style: "send_messages=false", "manage roles: true"
-    assign_re = re.compile(
-        r"(?P<name>[a-zA-Z_][a-zA-Z0-9_ -]{1,60})\s*(?:=|:)\s*(?P<val>true|false|yes|no|on|off|allow|deny|enabled|disabled|unset|clear|reset)",
-        re.IGNORECASE,
-    )
-    for match in assign_re.finditer(text):
+    for match in _ASSIGN_RE.finditer(text):
         raw_name = (match.group("name") or "").strip()
         raw_val = (match.group("val") or "").strip().lower()
         flag = resolve_permission_flag(raw_name)
@@ -275,8 +303,9 @@ def parse_permission_overwrites(text: str) -> PermissionParseResult:
     value_explicit = False
     index = 0
     max_tokens = 600
+    limit = min(len(tokens), max_tokens)
 
-    while index < min(len(tokens), max_tokens):
+    while index < limit:
         token = tokens[index]
         if token in _ALLOW_WORDS:
             permission_context = True
@@ -305,24 +334,12 @@ def parse_permission_overwrites(text: str) -> PermissionParseResult:
             index += 1
             continue
 
-        candidates = _PATTERNS_BY_FIRST.get(token, [])
-        matched = False
-        for pat_tokens, flag in candidates:
-            if tokens[index : index + len(pat_tokens)] != tuple(pat_tokens):
-                continue
-            value = current_value if value_explicit else True
-            if flag in overwrites and not value_explicit:
-                index += len(pat_tokens)
-                matched = True
-                break
-            overwrites[flag] = value
-            index += len(pat_tokens)
-            matched = True
-            break
-
-        if matched:
+        flag, length = _longest_flag_match(tokens, index)
+        if flag is None:
+            index += 1
             continue
-
-        index += 1
+        if value_explicit or flag not in overwrites:
+            overwrites[flag] = current_value if value_explicit else True
+        index += length
 
     return PermissionParseResult(overwrites=overwrites, unknown=tuple(unknown))
@@ -0,0 +1,66 @@
+import asyncio
+from collections import deque
+from typing import Any, Deque, List
+
+
+class FastAsyncQueue:
+    """
+    Deque-backed stand-in for asyncio.Queue on the internal stimulus/action channels.
+    Waiters park on an Event instead of a Future per item; raises asyncio.QueueFull and
+    asyncio.QueueEmpty so existing callers keep working. maxsize <= 0 means unbounded.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self._items: Deque[Any] = deque()
+        self._maxsize = maxsize
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def full(self) -> bool:
+        return 0 < self._maxsize <= len(self._items)
+
+    def put_nowait(self, item: Any) -> None:
+        if 0 < self._maxsize <= len(self._items):
+            raise asyncio.QueueFull
+        self._items.append(item)
+        self._not_empty.set()
+
+    async def put(self, item: Any) -> None:
+        while self.full():
+            self._not_full.clear()
+            await self._not_full.wait()
+        self.put_nowait(item)
+
+    def get_nowait(self) -> Any:
+        if not self._items:
+            raise asyncio.QueueEmpty
+        item = self._items.popleft()
+        self._not_full.set()
+        return item
+
+    async def get(self) -> Any:
+        while not self._items:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    def drain(self, max_items: int) -> List[Any]:
+        """
+        Pop up to max_items in FIFO order without waiting; one wakeup for any blocked putters.
+        """
+        items = self._items
+        popleft = items.popleft
+        batch = [popleft() for _ in range(min(max_items, len(items)))]
+        if batch:
+            self._not_full.set()
+        return batch
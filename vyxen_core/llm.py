@@ -1,7 +1,11 @@
+import hashlib
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 try:
     from dotenv import load_dotenv
@@ -37,6 +41,48 @@ _client: Optional[OpenAI] = None
 _breaker = CircuitBreaker("llm", threshold=3, window_seconds=90.0, cooldown_seconds=300.0)
 _logger = logging.getLogger("vyxen.llm")
 
+# Replies keyed by a digest of the full prompt, so only byte-identical requests (same message,
+# identity values, profile, topics and notes) are served from here. TTL <= 0 disables it.
+# Defaults mirror RuntimeConfig; the cognition loop applies the configured values.
+_reply_cache_ttl_s = 120.0
+_reply_cache_size = 256
+_reply_cache: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+_reply_cache_lock = threading.Lock()
+_cache_hits = 0
+_cache_misses = 0
+
+
+def _cached_reply(key: bytes) -> Optional[str]:
+    global _cache_hits, _cache_misses
+    now = time.monotonic()
+    with _reply_cache_lock:
+        entry = _reply_cache.get(key)
+        if entry is not None and entry[0] > now:
+            _reply_cache.move_to_end(key)
+            _cache_hits += 1
+            return entry[1]
+        if entry is not None:
+            del _reply_cache[key]
+        _cache_misses += 1
+        return None
+
+
+def _store_reply(key: bytes, reply: str) -> None:
+    with _reply_cache_lock:
+        _reply_cache[key] = (time.monotonic() + _reply_cache_ttl_s, reply)
+        _reply_cache.move_to_end(key)
+        while len(_reply_cache) > _reply_cache_size:
+            _reply_cache.popitem(last=False)
+
+
+def configure_reply_cache(ttl_seconds: float, max_entries: int) -> None:
+    global _reply_cache_ttl_s, _reply_cache_size
+    with _reply_cache_lock:
+        _reply_cache_ttl_s = ttl_seconds
+        _reply_cache_size = max_entries
+        while _reply_cache and len(_reply_cache) > max(0, max_entries):
+            _reply_cache.popitem(last=False)
+
 
 def _client_lazy() -> OpenAI:
     global _client
@@ -107,6 +153,13 @@ def craft_social_reply(
             ),
         },
     ]
+    cache_key: Optional[bytes] = None
+    if _reply_cache_ttl_s > 0 and _reply_cache_size > 0:
+        # The system prompt is constant, so the user turn alone identifies the request.
+        cache_key = hashlib.sha256(messages[1]["content"].encode("utf-8")).digest()
+        cached = _cached_reply(cache_key)
+        if cached is not None:
+            return cached
     try:
         completion = _client_lazy().chat.completions.create(
             model="venice-uncensored",
@@ -114,7 +167,10 @@ def craft_social_reply(
         )
         content = completion.choices[0].message.content
         _breaker.record_success()
-        return content.strip()[:1800] if content else ""
+        reply = content.strip()[:1800] if content else ""
+        if cache_key is not None and reply:
+            _store_reply(cache_key, reply)
+        return reply
     except Exception as exc:
         _breaker.record_failure(str(exc))
         _logger.warning("LLM reply failed; breaker count %d", len(_breaker.failures))
@@ -124,3 +180,7 @@ def craft_social_reply(
 
 def breaker_status() -> tuple[bool, str]:
     return _breaker.tripped, _breaker.reason
+
+
+def cache_stats() -> tuple[int, int]:
+    return _cache_hits, _cache_misses
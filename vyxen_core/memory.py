@@ -4,11 +4,13 @@ import logging
 import os
 import re
 import sqlite3
+import threading
 import time
 from collections import deque, Counter
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from .config import RuntimeConfig
 from .safety import CircuitBreaker
@@ -75,6 +77,8 @@ class CausalMemory:
         self.disabled_due_to_size = False
         self.disabled_reason = ""
         self.last_rotation_ts: float | None = None
+        # Per-thread write_batch() state: `active` flag plus the connection, opened on first write.
+        self._batch = threading.local()
         self._check_size_limit()
         self._init_db()
 
@@ -294,7 +298,7 @@ class CausalMemory:
             except Exception:
                 pass
 
-    def _execute_write(self, table: str, writer) -> None:
+    def _execute_write(self, table: str, writer, grows: bool = True) -> None:
         if not self.allow_writes:
             return
         if not self._breaker.allow():
@@ -303,10 +307,22 @@ class CausalMemory:
         self._prune_writes(now)
         if len(self._write_timestamps) >= self.config.memory_max_writes_per_second:
             return
+        batch = self._batch
         conn: sqlite3.Connection | None = None
         try:
+            if getattr(batch, "active", False):
+                # Inside write_batch(): the batch owns the connection and commits once on exit.
+                batch_conn = batch.conn
+                if batch_conn is None:
+                    batch_conn = batch.conn = self._open_conn()
+                if grows and self._table_over_limit(batch_conn, table):
+                    self.logger.warning("Memory limit reached for table %s; skipping write", table)
+                    return
+                writer(batch_conn)
+                self._write_timestamps.append(time.time())
+                return
             conn = self._open_conn()
-            if self._table_over_limit(conn, table):
+            if grows and self._table_over_limit(conn, table):
                 self.logger.warning("Memory limit reached for table %s; skipping write", table)
                 return
             writer(conn)
@@ -327,6 +343,51 @@ class CausalMemory:
                 except Exception:
                     pass
 
+    @contextmanager
+    def write_batch(self) -> Iterator[None]:
+        """
+        Route this thread's writes through one connection and commit them together on exit.
+        Only for pure writes: other connections do not see the rows until the commit.
+        """
+        batch = self._batch
+        if (
+            getattr(batch, "active", False)
+            or not self.allow_writes
+            or self.disabled_due_to_size
+            or not self._breaker.allow()
+        ):
+            yield
+            return
+        batch.active = True
+        batch.conn = None
+        try:
+            yield
+        finally:
+            conn = batch.conn
+            batch.active = False
+            batch.conn = None
+            # No connection means nothing was written, so there is nothing to commit.
+            if conn is not None:
+                self._commit_batch(conn)
+
+    def _commit_batch(self, conn: sqlite3.Connection) -> None:
+        try:
+            if conn.in_transaction:
+                conn.commit()
+                self._breaker.record_success()
+        except sqlite3.OperationalError as exc:
+            if "locked" in str(exc).lower():
+                self.logger.warning("Memory batch write skipped: %s", exc)
+            else:
+                self._breaker.record_failure(str(exc))
+        except Exception as exc:
+            self._breaker.record_failure(str(exc))
+        finally:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
     # ---------------------------------------------
     # Maintenance and rotation
     # ---------------------------------------------
@@ -593,10 +654,27 @@ class CausalMemory:
     ) -> Dict[str, float]:
         server_id = server_id or "global"
         current = self.get_user_profile(server_id, user_id)
+        changed = False
         for key, delta in deltas.items():
-            if key not in current:
+            old = current.get(key)
+            if old is None:
                 continue
-            current[key] = clamp01(current[key] + delta)
+            new = clamp01(old + delta)
+            if new != old:
+                current[key] = new
+                changed = True
+        if not changed:
+            # Every trait is pinned at a bound (or the deltas are zero), so the data stands, but
+            # the table trim evicts by `updated`; keep this active user's row fresh.
+            self._execute_write(
+                "user_profiles",
+                lambda conn: conn.execute(
+                    "UPDATE user_profiles SET updated = ? WHERE server_id = ? AND user_id = ?",
+                    (time.time(), server_id, str(user_id)),
+                ),
+                grows=False,
+            )
+            return current
         self._execute_write(
             "user_profiles",
             lambda conn: conn.execute(
@@ -8,7 +8,7 @@ from ..memory import CausalMemory
 from ..state import InternalState
 
 
-@dataclass
+@dataclass(slots=True)
 class RealityOutput:
     reality: str
     recommended_action: ActionIntent | None
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional
 
 from ..actions import ActionIntent
 from ..identity import IdentityCore
@@ -11,6 +11,8 @@ from .base import RealityOutput
 
 @dataclass
 class NarrativeReality:
+    # Reads memory (SQLite), so the cognition loop gives it its own worker.
+    blocking_io: ClassVar[bool] = True
     name: str = "NarrativeReality"
 
     def interpret(
@@ -1,6 +1,6 @@
 import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import ClassVar, Dict, List, Optional, Tuple
 
 from ..actions import ActionIntent
 from ..identity import IdentityCore
@@ -14,6 +14,8 @@ from ..config import RuntimeConfig
 
 @dataclass
 class SocialReality:
+    # Reads memory and may call the LLM, so the cognition loop gives it its own worker.
+    blocking_io: ClassVar[bool] = True
     name: str = "SocialReality"
     config: RuntimeConfig | None = None
     session_replies: Dict[Tuple[str, int, int], Dict[str, any]] = field(default_factory=dict)
@@ -74,3 +74,5 @@ class SafetyDiagnostics:
     tool_breaker_reason: str = ""
     memory_breaker_reason: str = ""
     llm_breaker_reason: str = ""
+    llm_cache_hits: int = 0
+    llm_cache_misses: int = 0
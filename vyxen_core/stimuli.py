@@ -3,14 +3,14 @@ from dataclasses import dataclass, field
 from typing import Any, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Stimulus:
     type: str
     source: str
     context: Dict[str, Any] = field(default_factory=dict)
     salience: float = 0.5
     routing: str = "ambient"  # directed | ambient | system
-    timestamp: float = field(default_factory=lambda: time.time())
+    timestamp: float = field(default_factory=time.time)
 
     def amplify(self, factor: float) -> "Stimulus":
         self.salience = max(0.0, min(1.0, self.salience * factor))
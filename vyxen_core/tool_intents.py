@@ -1,16 +1,131 @@
 import re
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from .stimuli import Stimulus
 from .safety import CircuitBreaker
-from .discord_permissions import parse_permission_overwrites
+from .discord_permissions import PermissionParseResult, parse_permission_overwrites
 
 _breaker = CircuitBreaker("intent_parser", threshold=5, window_seconds=60.0, cooldown_seconds=180.0)
 
+# Case-insensitive patterns are compiled twice: case-sensitive for the lowercased copy of
+# ASCII messages, and with IGNORECASE as the fallback for anything else.
+_CiPair = tuple["re.Pattern[str]", "re.Pattern[str]"]
 
-@dataclass
+
+def _ci_pair(pattern: str) -> _CiPair:
+    return re.compile(pattern), re.compile(pattern, re.IGNORECASE)
+
+
+class _FoldedMatch:
+    """
+    Match found in the lowercased copy; groups are sliced from the original text so names keep their casing.
+    """
+
+    __slots__ = ("_match", "_text")
+
+    def __init__(self, match: "re.Match[str]", text: str):
+        self._match = match
+        self._text = text
+
+    def group(self, idx: int = 0) -> Optional[str]:
+        start, end = self._match.span(idx)
+        return None if start < 0 else self._text[start:end]
+
+
+# Fixed patterns are compiled once at import; keyword-parameterised ones go through _ci_pattern.
+_FAQ_ADD_QUOTED_RE = _ci_pair(r'add\s+faq\s+[\"“”\']([^\"“”\']{1,120})[\"“”\']\s*=\s*(.+)$')
+_FAQ_ADD_RE = _ci_pair(r'add\s+faq\s+([^=]{1,120})=\s*(.+)$')
+_FAQ_ANSWER_RE = _ci_pair(r'(?:answer\s+faq|faq)\s+[\"“”\']?(.+?)[\"“”\']?$')
+_FAQ_REMOVE_RE = _ci_pair(r'(?:remove|delete)\s+faq\s+[\"“”\']?(.+?)[\"“”\']?$')
+_WELCOME_FOCUS_RE = _ci_pair(r"welcome message(?:\s+(?:for|about)\s+(.+))?$")
+_WELCOME_CHANNEL_RE = re.compile(r"in\s+#?([a-zA-Z0-9_-]{1,60})")
+_MACRO_SAVE_RE = _ci_pair(r'save\s+macro\s+[\"“”\']([^\"“”\']{1,60})[\"“”\']\s*=\s*(.+)$')
+_MACRO_RUN_RE = _ci_pair(r'run\s+macro\s+[\"“”\']?([^\"“”\']{1,60})[\"“”\']?')
+_SCHEDULE_IN_RE = _ci_pair(r"schedule\s+(.+?)\s+in\s+(\d+)\s*(s|sec|seconds|m|min|minutes|h|hours|d|days)")
+_SCHEDULE_AT_RE = _ci_pair(r"schedule\s+(.+?)\s+at\s+([0-2]?\d:\d{2}(?:\s*(?:am|pm))?)")
+_QUOTED_RE = re.compile(r"[\"“”']([^\"“”']{1,80})[\"“”']")
+_UNDER_CATEGORY_QUOTED_RE = _ci_pair(r"\b(?:under|in|inside|within)\s+(?:the\s+)?[\"“”']([^\"“”']{1,80})[\"“”']\s+category\b")
+_UNDER_CATEGORY_RE = _ci_pair(r"\b(?:under|in|inside|within)\s+(?:the\s+)?([a-zA-Z0-9 _-]{1,64})\s+category\b")
+_ROLE_FOR_OF_RE = _ci_pair(r"(?:for|of)\s+(?:the\s+)?([a-zA-Z0-9 _-]{1,64})\s+role")
+_ASSIGN_ROLE_RE = _ci_pair(r"\b(?:assign|give|grant|add)\b\s+(?:me\s+)?(?:the\s+)?([a-zA-Z0-9 _-]{1,64})\s+role\b")
+_ROLE_TO_FOR_RE = _ci_pair(r"(?:to|for)\s+(?:the\s+)?([a-zA-Z0-9 _-]{1,64})\s+role\b")
+_GIVE_ROLE_RE = _ci_pair(r"give\s+@?[^\s]+\s+([a-zA-Z0-9 _-]{1,64})")
+_DELETE_ROLE_CMD_RE = re.compile(r"\b(?:delete|remove)\s+role\b")
+_BAN_RE = re.compile(r"\bban\b")
+_TIMEOUT_RE = re.compile(r"\b(?:mute\s+(?:member|user)|timeout)\b")
+_DELETE_ROLE_NAME_RE = _ci_pair(r"(?:delete|remove)\s+role\s+([a-zA-Z0-9 _-]{1,64})")
+_DURATION_RE = _ci_pair(r"\b(\d{1,4})\s*(s|sec|secs|second|seconds|m|min|mins|minute|minutes|h|hr|hrs|hour|hours|d|day|days)\b")
+_USER_ID_RE = re.compile(r"\b(\d{17,20})\b")
+_QUOTED_CATEGORY_RE = _ci_pair(r"[\"“”']([^\"“”']{1,80})[\"“”']\s+category")
+_QUOTED_CHANNEL_RE = _ci_pair(r"[\"“”']([^\"“”']{1,80})[\"“”']\s+(?:(?:text|voice)\s+)?channel")
+_LOCK_CATEGORY_RE = _ci_pair(r"(?:lock|restrict|hide)\s+(?:the\s+)?([a-zA-Z0-9 _-]{1,64})\s+category")
+_ONLY_ROLE_RE = _ci_pair(r"only\s+(?:the\s+)?([a-zA-Z0-9 _-]{1,64})\s+role")
+_IMPLICIT_CHANNEL_RE = re.compile(r"^(?:text|voice)\s+channel\b")
+
+# Substrings that at least one intent branch requires (substring semantics, like the
+# branch guards themselves). Keep in sync when adding a branch with new vocabulary.
+_TRIGGER_WORDS = (
+    "active", "activity", "add", "admin", "audit", "ban", "category", "change", "channel",
+    "count", "create", "faq", "give", "going on", "happened", "just", "last", "macro",
+    "make", "mute", "permission", "quarantine", "role", "schedule", "server", "set up",
+    "setup", "timeout", "today", "undo", "user", "welcome", "why",
+)
+_TRIGGER_RE = re.compile("|".join(map(re.escape, _TRIGGER_WORDS)))
+
+# Phrase-only read-only report intents, checked in this order (first hit wins).
+# user_activity_summary additionally needs a mentioned user.
+_REPORT_PHRASES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    (
+        "server_activity_report",
+        (
+            "what changed recently",
+            "recent changes",
+            "what has changed",
+            "what’s been going on",
+            "whats been going on",
+            "how active is this server",
+            "server activity",
+            "what happened lately",
+        ),
+    ),
+    (
+        "channel_activity_report",
+        (
+            "most active channels",
+            "most active channel",
+            "channel activity",
+            "which channels are most active",
+            "activity heatmap",
+        ),
+    ),
+    ("user_activity_summary", ("how active is", "activity for", "activity of")),
+    (
+        "audit_summary",
+        (
+            "summarize admin actions",
+            "admin summary",
+            "audit summary",
+            "what did admins do today",
+            "what did you do today",
+        ),
+    ),
+    (
+        "last_action_explain",
+        ("what did you just do", "what did you just change", "last thing you did", "explain the last thing you did"),
+    ),
+)
+
+
+@lru_cache(maxsize=64)
+def _ci_pattern(pattern: str) -> _CiPair:
+    return _ci_pair(pattern)
+
+
+@dataclass(slots=True, frozen=True)
 class ParsedIntent:
     intent_type: str
     target_channel: Optional[int]
@@ -20,15 +135,56 @@ class ParsedIntent:
     dry_run: bool = False
 
 
+_INTENT_CACHE_SIZE = 128
+_intent_cache: "OrderedDict[tuple, Optional[ParsedIntent]]" = OrderedDict()
+# Parsed with the wall clock (execute_at), so never served from the cache.
+_UNCACHEABLE_INTENTS = frozenset({"schedule_action"})
+
+
+def _intent_cache_key(context: Dict[str, Any]) -> tuple:
+    return (
+        context.get("content", ""),
+        context.get("channel_id"),
+        context.get("author_id"),
+        bool(context.get("setup_wizard_active")),
+        tuple(context.get("mentioned_user_ids") or ()),
+        tuple(context.get("channel_mentions") or ()),
+        tuple(context.get("role_mentions") or ()),
+    )
+
+
 def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
     """
     Lightweight intent parser for admin-style server management requests.
+    Results (including misses) are cached per content + mention context; hits return a copy.
     """
     if not _breaker.allow():
         return None
     if stimulus.type != "discord_message":
         return None
 
+    try:
+        key = _intent_cache_key(stimulus.context)
+        hash(key)
+    except TypeError:
+        return _parse_intent(stimulus)
+    if key in _intent_cache:
+        _intent_cache.move_to_end(key)
+        cached = _intent_cache[key]
+        return None if cached is None else replace(cached, requested_changes=dict(cached.requested_changes))
+
+    parsed = _parse_intent(stimulus)
+    if parsed is None or parsed.intent_type not in _UNCACHEABLE_INTENTS:
+        _intent_cache[key] = None if parsed is None else replace(parsed, requested_changes=dict(parsed.requested_changes))
+        if len(_intent_cache) > _INTENT_CACHE_SIZE:
+            _intent_cache.popitem(last=False)
+    return parsed
+
+
+parse_natural_language_intent.cache_clear = _intent_cache.clear  # type: ignore[attr-defined]
+
+
+def _parse_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
     try:
         content_raw = stimulus.context.get("content", "")
         content = content_raw.lower().strip()
@@ -42,6 +198,17 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
                 content_raw = content_raw[len(prefix):].lstrip()
                 content = content[len(prefix):].lstrip()
                 break
+        # Lowercase once and match case-sensitively: IGNORECASE folds every character and
+        # disables the literal-prefix scan. Only ASCII keeps spans aligned with content_raw.
+        folded_raw = content_raw.lower() if content_raw.isascii() else None
+
+        def _ci_search(patterns: _CiPair, text: str):
+            exact, ignorecase = patterns
+            if folded_raw is None or text is not content_raw:
+                return ignorecase.search(text)
+            m = exact.search(folded_raw)
+            return _FoldedMatch(m, text) if m else None
+
         # --------------------
         # Setup wizard (guidance only)
         # --------------------
@@ -72,12 +239,21 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
                 requires_admin=True,
                 dry_run=dry_run_request,
             )
+        # Every branch below needs one of _TRIGGER_WORDS in the message (or a channel/role
+        # mention), so ordinary chat is rejected in a single scan.
+        if not _TRIGGER_RE.search(content) and not (
+            stimulus.context.get("channel_mentions") or stimulus.context.get("role_mentions")
+        ):
+            return None
         # --------------------
         # FAQ builder
         # --------------------
-        m = re.search(r'add\s+faq\s+[\"“”\']([^\"“”\']{1,120})[\"“”\']\s*=\s*(.+)$', content_raw, flags=re.IGNORECASE)
-        if not m:
-            m = re.search(r'add\s+faq\s+([^=]{1,120})=\s*(.+)$', content_raw, flags=re.IGNORECASE)
+        # Literal guards ahead of the regex-only branches: a substring test is far cheaper
+        # than a failed search, and each pattern below requires its literal to match.
+        has_faq = "faq" in content
+        m = _ci_search(_FAQ_ADD_QUOTED_RE, content_raw) if has_faq else None
+        if not m and has_faq:
+            m = _ci_search(_FAQ_ADD_RE, content_raw)
         if m:
             question = (m.group(1) or "").strip()
             answer = (m.group(2) or "").strip()
@@ -99,7 +275,7 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
                 requires_admin=False,
                 dry_run=dry_run_request,
             )
-        m = re.search(r'(?:answer\s+faq|faq)\s+[\"“”\']?(.+?)[\"“”\']?$', content_raw, flags=re.IGNORECASE)
+        m = _ci_search(_FAQ_ANSWER_RE, content_raw) if has_faq else None
         if m:
             question = (m.group(1) or "").strip()
             if question:
@@ -112,7 +288,7 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
                     dry_run=dry_run_request,
                 )
         if content.startswith("remove faq") or content.startswith("delete faq"):
-            m = re.search(r'(?:remove|delete)\s+faq\s+[\"“”\']?(.+?)[\"“”\']?$', content_raw, flags=re.IGNORECASE)
+            m = _ci_search(_FAQ_REMOVE_RE, content_raw)
             if m:
                 question = (m.group(1) or "").strip()
                 if question:
@@ -131,10 +307,10 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
             focus = ""
             tone = ""
             channels = ""
-            m_focus = re.search(r"welcome message(?:\s+(?:for|about)\s+(.+))?$", content_raw, flags=re.IGNORECASE)
+            m_focus = _ci_search(_WELCOME_FOCUS_RE, content_raw)
             if m_focus:
                 focus = (m_focus.group(1) or "").strip()
-            m_channels = re.search(r"in\s+#?([a-zA-Z0-9_-]{1,60})", content_raw)
+            m_channels = _WELCOME_CHANNEL_RE.search(content_raw)
             if m_channels:
                 channels = f"#{m_channels.group(1)}"
             if "friendly" in content or "casual" in content:
@@ -153,7 +329,7 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
         # Macros
         # --------------------
         if content.startswith("save macro"):
-            m = re.search(r'save\s+macro\s+[\"“”\']([^\"“”\']{1,60})[\"“”\']\s*=\s*(.+)$', content_raw, flags=re.IGNORECASE)
+            m = _ci_search(_MACRO_SAVE_RE, content_raw)
             if m:
                 name = (m.group(1) or "").strip()
                 body = (m.group(2) or "").strip()
@@ -167,7 +343,7 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
                         dry_run=dry_run_request,
                     )
         if content.startswith("run macro"):
-            m = re.search(r'run\s+macro\s+[\"“”\']?([^\"“”\']{1,60})[\"“”\']?', content_raw, flags=re.IGNORECASE)
+            m = _ci_search(_MACRO_RUN_RE, content_raw)
             if m:
                 name = (m.group(1) or "").strip()
                 return ParsedIntent(
@@ -192,8 +368,8 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
         # --------------------
         if content.startswith("schedule"):
             # schedule <action> in <duration> or at <time>
-            m_in = re.search(r"schedule\s+(.+?)\s+in\s+(\d+)\s*(s|sec|seconds|m|min|minutes|h|hours|d|days)", content_raw, flags=re.IGNORECASE)
-            m_at = re.search(r"schedule\s+(.+?)\s+at\s+([0-2]?\d:\d{2}(?:\s*(?:am|pm))?)", content_raw, flags=re.IGNORECASE)
+            m_in = _ci_search(_SCHEDULE_IN_RE, content_raw)
+            m_at = _ci_search(_SCHEDULE_AT_RE, content_raw)
             action_text = None
             execute_at = None
             confirmed = "confirm" in content
@@ -275,7 +451,7 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
             # Supports straight + curly quotes and single quotes.
             return [
                 m.group(1).strip()
-                for m in re.finditer(r"[\"“”']([^\"“”']{1,80})[\"“”']", text)
+                for m in _QUOTED_RE.finditer(text)
                 if m.group(1).strip()
             ]
 
@@ -287,10 +463,9 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
               - text channel "general"
               - role 'Mods'
             """
-            m = re.search(
-                rf"{keyword_pattern}\s*[\"“”']([^\"“”']{{1,80}})[\"“”']",
+            m = _ci_search(
+                _ci_pattern(rf"{keyword_pattern}\s*[\"“”']([^\"“”']{{1,80}})[\"“”']"),
                 text,
-                flags=re.IGNORECASE,
             )
             if not m:
                 return None
@@ -298,10 +473,9 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
 
         def _extract_named(text: str, keyword: str) -> Optional[str]:
             # e.g. "role called test", "channel named test"
-            m = re.search(
-                rf"{keyword}\s+(?:called|named)\s+([a-zA-Z0-9 _-]{{1,64}})",
+            m = _ci_search(
+                _ci_pattern(rf"{keyword}\s+(?:called|named)\s+([a-zA-Z0-9 _-]{{1,64}})"),
                 text,
-                flags=re.IGNORECASE,
             )
             if not m:
                 return None
@@ -317,47 +491,47 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
                 pat = r"(?:create|make|add|set up|setup)\s+(?:a\s+new\s+)?(?:(?:text|voice)\s+)?channel\s+([a-zA-Z0-9 _-]{1,64})"
             else:
                 pat = rf"(?:create|make|add|set up|setup)\s+(?:a\s+new\s+)?{keyword}\s+([a-zA-Z0-9 _-]{{1,64}})"
-            m = re.search(pat, text, flags=re.IGNORECASE)
+            m = _ci_search(_ci_pattern(pat), text)
             if not m:
                 return None
             name = _cleanup_name(m.group(1))
             return name or None
 
         def _extract_under_category(text: str) -> Optional[str]:
-            m = re.search(
-                r"\b(?:under|in|inside|within)\s+(?:the\s+)?[\"“”']([^\"“”']{1,80})[\"“”']\s+category\b",
-                text,
-                flags=re.IGNORECASE,
-            )
+            m = _ci_search(_UNDER_CATEGORY_QUOTED_RE, text)
             if m:
                 return (m.group(1) or "").strip()
-            m = re.search(
-                r"\b(?:under|in|inside|within)\s+(?:the\s+)?([a-zA-Z0-9 _-]{1,64})\s+category\b",
-                text,
-                flags=re.IGNORECASE,
-            )
+            m = _ci_search(_UNDER_CATEGORY_RE, text)
             if m:
                 return _cleanup_name(m.group(1)) or None
             return None
 
         def _extract_called_after(keyword_pattern: str, text: str) -> Optional[str]:
             # Allow a small span between the keyword and "called"/"named".
-            m = re.search(
-                rf"{keyword_pattern}[^\\n]{{0,140}}?\\b(?:called|named)\\b\\s*[\"“”']([^\"“”']{{1,80}})[\"“”']",
+            m = _ci_search(
+                _ci_pattern(rf"{keyword_pattern}[^\\n]{{0,140}}?\\b(?:called|named)\\b\\s*[\"“”']([^\"“”']{{1,80}})[\"“”']"),
                 text,
-                flags=re.IGNORECASE,
             )
             if m:
                 return (m.group(1) or "").strip()
-            m = re.search(
-                rf"{keyword_pattern}[^\\n]{{0,140}}?\\b(?:called|named)\\b\\s+([a-zA-Z0-9 _-]{{1,64}})",
+            m = _ci_search(
+                _ci_pattern(rf"{keyword_pattern}[^\\n]{{0,140}}?\\b(?:called|named)\\b\\s+([a-zA-Z0-9 _-]{{1,64}})"),
                 text,
-                flags=re.IGNORECASE,
             )
             if m:
                 return _cleanup_name(m.group(1)) or None
             return None
 
+        perm_parse: Optional[PermissionParseResult] = None
+
+        def _perm_spec() -> Dict[str, Optional[bool]]:
+            # Several branches may need the permission parse; do it once per message and
+            # hand each caller its own dict since they add defaults in place.
+            nonlocal perm_parse
+            if perm_parse is None:
+                perm_parse = parse_permission_overwrites(content_raw)
+            return dict(perm_parse.overwrites)
+
         # --------------------
         # Role permissions report (role-level, not channel overwrites)
         # --------------------
@@ -368,11 +542,7 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
         ):
             role_name = _extract_keyword_quoted(content_raw, r"role") or _extract_named(content_raw, "role")
             if not role_name:
-                m = re.search(
-                    r"(?:for|of)\s+(?:the\s+)?([a-zA-Z0-9 _-]{1,64})\s+role",
-                    content_raw,
-                    flags=re.IGNORECASE,
-                )
+                m = _ci_search(_ROLE_FOR_OF_RE, content_raw)
                 if m:
                     role_name = _cleanup_name(m.group(1))
             if not role_name and "admin role" in content:
@@ -487,11 +657,7 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
         ):
             role_name = _extract_keyword_quoted(content_raw, r"role") or _extract_named(content_raw, "role")
             if not role_name:
-                m = re.search(
-                    r"\b(?:assign|give|grant|add)\b\s+(?:me\s+)?(?:the\s+)?([a-zA-Z0-9 _-]{1,64})\s+role\b",
-                    content_raw,
-                    flags=re.IGNORECASE,
-                )
+                m = _ci_search(_ASSIGN_ROLE_RE, content_raw)
                 if m:
                     role_name = _cleanup_name(m.group(1))
 
@@ -503,7 +669,7 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
                 if stimulus.context.get("author_id") is not None:
                     member_id = str(stimulus.context.get("author_id"))
             if member_id is None:
-                m = re.search(r"\b(\d{17,20})\b", content_raw)
+                m = _USER_ID_RE.search(content_raw)
                 if m:
                     member_id = m.group(1)
 
@@ -529,16 +695,12 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
             and any(word in content for word in ["permission", "permissions"])
             and not (("channel" in content) or channel_mentions)
         ):
-            perm_spec = parse_permission_overwrites(content_raw).overwrites
+            perm_spec = _perm_spec()
             server_level_hints = {"administrator", "ban_members", "kick_members", "manage_guild", "view_audit_log"}
             if perm_spec and (set(perm_spec.keys()) & server_level_hints):
                 role_name = _extract_keyword_quoted(content_raw, r"role") or _extract_named(content_raw, "role")
                 if not role_name:
-                    m = re.search(
-                        r"(?:to|for)\s+(?:the\s+)?([a-zA-Z0-9 _-]{1,64})\s+role\b",
-                        content_raw,
-                        flags=re.IGNORECASE,
-                    )
+                    m = _ci_search(_ROLE_TO_FOR_RE, content_raw)
                     if m:
                         role_name = _cleanup_name(m.group(1))
                 if not role_name and "admin role" in content:
@@ -570,7 +732,7 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
             target_role = role_mentions[0] if role_mentions else None
 
             wants_update = any(word in content for word in ["fix", "update", "change", "set", "allow", "deny", "grant", "give", "revoke", "remove"])
-            perm_spec = parse_permission_overwrites(content_raw).overwrites
+            perm_spec = _perm_spec()
 
             wants_channel_access = any(
                 phrase in content
@@ -642,7 +804,7 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
             mentioned = stimulus.context.get("mentioned_user_ids", [])
             member_id = str(mentioned[0]) if mentioned else None
             if role_name is None:
-                m = re.search(r"give\s+@?[^\s]+\s+([a-zA-Z0-9 _-]{1,64})", content_raw, flags=re.IGNORECASE)
+                m = _ci_search(_GIVE_ROLE_RE, content_raw)
                 if m:
                     role_name = _cleanup_name(m.group(1))
             if role_name is None and "admin" in content:
@@ -665,14 +827,10 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
         # --------------------
         confirm = "confirm" in content
 
-        if re.search(r"\b(?:delete|remove)\s+role\b", content):
+        if "role" in content and _DELETE_ROLE_CMD_RE.search(content):
             role_name = _extract_keyword_quoted(content_raw, r"role") or _extract_named(content_raw, "role")
             if not role_name:
-                m = re.search(
-                    r"(?:delete|remove)\s+role\s+([a-zA-Z0-9 _-]{1,64})",
-                    content_raw,
-                    flags=re.IGNORECASE,
-                )
+                m = _ci_search(_DELETE_ROLE_NAME_RE, content_raw)
                 if m:
                     role_name = _cleanup_name(m.group(1))
             requested: Dict[str, Any] = {"confirmed": confirm}
@@ -687,14 +845,14 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
                 dry_run=dry_run_request,
             )
 
-        if re.search(r"\bban\s+(?:member|user)\b", content) or re.search(r"\bban\b", content):
+        if "ban" in content and _BAN_RE.search(content):
             member_id = None
             # Prefer explicit mention IDs when available.
             mentioned = stimulus.context.get("mentioned_user_ids", [])
             if mentioned:
                 member_id = str(mentioned[0])
             if member_id is None:
-                m = re.search(r"\b(\d{17,20})\b", content_raw)
+                m = _USER_ID_RE.search(content_raw)
                 if m:
                     member_id = m.group(1)
             if member_id:
@@ -707,18 +865,18 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
                     dry_run=dry_run_request,
                 )
 
-        if re.search(r"\b(?:mute|timeout)\s+(?:member|user)\b", content) or re.search(r"\btimeout\b", content):
+        if _TIMEOUT_RE.search(content):
             member_id = None
             mentioned = stimulus.context.get("mentioned_user_ids", [])
             if mentioned:
                 member_id = str(mentioned[0])
             if member_id is None:
-                m = re.search(r"\b(\d{17,20})\b", content_raw)
+                m = _USER_ID_RE.search(content_raw)
                 if m:
                     member_id = m.group(1)
 
             def _parse_duration_seconds(text: str) -> int:
-                m = re.search(r"\b(\d{1,4})\s*(s|sec|secs|second|seconds|m|min|mins|minute|minutes|h|hr|hrs|hour|hours|d|day|days)\b", text, flags=re.IGNORECASE)
+                m = _ci_search(_DURATION_RE, text)
                 if not m:
                     return 600
                 qty = int(m.group(1))
@@ -749,7 +907,7 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
         if "quarantine" in content and any(word in content for word in ["setup", "set up", "create"]) and any(
             word in content for word in ["assign", "apply", "give"]
         ):
-            m = re.search(r"\b(\d{17,20})\b", content_raw)
+            m = _USER_ID_RE.search(content_raw)
             if m:
                 member_id = m.group(1)
                 return ParsedIntent(
@@ -770,7 +928,7 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
         # User profile report (from Vyxen memory)
         # --------------------
         if ("tell me about" in content or "about user" in content) and "user" in content:
-            m = re.search(r"\b(\d{17,20})\b", content_raw)
+            m = _USER_ID_RE.search(content_raw)
             if m:
                 return ParsedIntent(
                     intent_type="user_profile_report",
@@ -782,101 +940,26 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
                 )
 
         # --------------------
-        # Server activity / recent changes (read-only, no LLM)
+        # Read-only reports (server/channel/user activity, audit summary, last action)
         # --------------------
-        activity_like = any(
-            phrase in content
-            for phrase in [
-                "what changed recently",
-                "recent changes",
-                "what has changed",
-                "what’s been going on",
-                "whats been going on",
-                "how active is this server",
-                "server activity",
-                "what happened lately",
-            ]
-        )
-        if activity_like:
+        mentioned_user_ids = stimulus.context.get("mentioned_user_ids")
+        for report_intent, phrases in _REPORT_PHRASES:
+            if not any(phrase in content for phrase in phrases):
+                continue
+            report_changes: Dict[str, Any] = {}
+            if report_intent == "user_activity_summary":
+                if not mentioned_user_ids:
+                    continue
+                report_changes["user_id"] = str(mentioned_user_ids[0])
             return ParsedIntent(
-                intent_type="server_activity_report",
+                intent_type=report_intent,
                 target_channel=default_channel,
                 target_role=None,
-                requested_changes={},
+                requested_changes=report_changes,
                 requires_admin=False,
                 dry_run=dry_run_request,
             )
 
-        # --------------------
-        # Channel activity heatmap
-        # --------------------
-        if any(
-            phrase in content
-            for phrase in [
-                "most active channels",
-                "most active channel",
-                "channel activity",
-                "which channels are most active",
-                "activity heatmap",
-            ]
-        ):
-            return ParsedIntent(
-                intent_type="channel_activity_report",
-                target_channel=default_channel,
-                target_role=None,
-                requested_changes={},
-                requires_admin=False,
-                dry_run=dry_run_request,
-            )
-
-        # --------------------
-        # User activity summary
-        # --------------------
-        if any(phrase in content for phrase in ["how active is", "activity for", "activity of"]) and stimulus.context.get("mentioned_user_ids"):
-            user_id = str(stimulus.context.get("mentioned_user_ids")[0])
-            return ParsedIntent(
-                intent_type="user_activity_summary",
-                target_channel=default_channel,
-                target_role=None,
-                requested_changes={"user_id": user_id},
-                requires_admin=False,
-                dry_run=dry_run_request,
-            )
-
-        # --------------------
-        # Audit summaries
-        # --------------------
-        if any(
-            phrase in content
-            for phrase in [
-                "summarize admin actions",
-                "admin summary",
-                "audit summary",
-                "what did admins do today",
-                "what did you do today",
-            ]
-        ):
-            return ParsedIntent(
-                intent_type="audit_summary",
-                target_channel=default_channel,
-                target_role=None,
-                requested_changes={},
-                requires_admin=False,
-                dry_run=dry_run_request,
-            )
-
-        # --------------------
-        # Last action explain/undo (read-only or explain)
-        # --------------------
-        if any(phrase in content for phrase in ["what did you just do", "what did you just change", "last thing you did", "explain the last thing you did"]):
-            return ParsedIntent(
-                intent_type="last_action_explain",
-                target_channel=default_channel,
-                target_role=None,
-                requested_changes={},
-                requires_admin=False,
-                dry_run=dry_run_request,
-            )
         if "undo" in content and "last action" in content:
             return ParsedIntent(
                 intent_type="undo_last_action",
@@ -896,11 +979,7 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
 
             category_name = _extract_keyword_quoted(content_raw, r"category") or _extract_named(content_raw, "category")
             if not category_name:
-                m = re.search(
-                    r"[\"“”']([^\"“”']{1,80})[\"“”']\s+category",
-                    content_raw,
-                    flags=re.IGNORECASE,
-                )
+                m = _ci_search(_QUOTED_CATEGORY_RE, content_raw)
                 if m:
                     category_name = (m.group(1) or "").strip()
 
@@ -908,11 +987,7 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
                 content_raw, r"(?:(?:text|voice)\s+)?channel"
             ) or _extract_named(content_raw, "channel")
             if not channel_name:
-                m = re.search(
-                    r"[\"“”']([^\"“”']{1,80})[\"“”']\s+(?:(?:text|voice)\s+)?channel",
-                    content_raw,
-                    flags=re.IGNORECASE,
-                )
+                m = _ci_search(_QUOTED_CHANNEL_RE, content_raw)
                 if m:
                     channel_name = (m.group(1) or "").strip()
 
@@ -945,11 +1020,7 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
             strict = any(word in content for word in ["only", "just"])
             category_name = _extract_keyword_quoted(content_raw, r"category") or _extract_named(content_raw, "category")
             if not category_name:
-                m = re.search(
-                    r"(?:lock|restrict|hide)\s+(?:the\s+)?([a-zA-Z0-9 _-]{1,64})\s+category",
-                    content_raw,
-                    flags=re.IGNORECASE,
-                )
+                m = _ci_search(_LOCK_CATEGORY_RE, content_raw)
                 if m:
                     category_name = _cleanup_name(m.group(1))
             if not category_name and "admin category" in content:
@@ -957,11 +1028,7 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
 
             role_name = _extract_keyword_quoted(content_raw, r"role") or _extract_named(content_raw, "role")
             if not role_name:
-                m = re.search(
-                    r"only\s+(?:the\s+)?([a-zA-Z0-9 _-]{1,64})\s+role",
-                    content_raw,
-                    flags=re.IGNORECASE,
-                )
+                m = _ci_search(_ONLY_ROLE_RE, content_raw)
                 if m:
                     role_name = _cleanup_name(m.group(1))
             if not role_name and "admin role" in content:
@@ -987,7 +1054,7 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
         # Create / setup intents
         # --------------------
         create_verbs = any(verb in content for verb in ["create", "make", "set up", "setup", "add"])
-        implicit_channel_create = bool(re.match(r"^(?:text|voice)\s+channel\b", content))
+        implicit_channel_create = bool(_IMPLICIT_CHANNEL_RE.match(content))
         if not (create_verbs or implicit_channel_create):
             return None
 
@@ -1079,7 +1146,7 @@ def parse_natural_language_intent(stimulus: Stimulus) -> Optional[ParsedIntent]:
         )
 
         if wants_permissions:
-            perm_spec = parse_permission_overwrites(content_raw).overwrites
+            perm_spec = _perm_spec()
             if wants_channel_access and not any(key in perm_spec for key in ["view_channel", "read_messages"]):
                 perm_spec["view_channel"] = True
             if perm_spec: